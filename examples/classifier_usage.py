@@ -5,6 +5,7 @@ This example demonstrates how to use the new AIWand classifier functionality
 for text classification and grading tasks.
 """
 
+import asyncio
 import aiwand
 from dotenv import load_dotenv
 
@@ -70,21 +71,35 @@ def main():
         use_reasoning=True
     )
     
-    # Use it multiple times
+    # Use it multiple times - the requests run concurrently
     questions = [
         ("What is 5 + 3?", "8", "8"),
         ("What is 10 / 2?", "5", "5"),
         ("What is 7 * 6?", "43", "42"),  # Wrong answer
     ]
     
-    for question, answer, expected in questions:
-        result = math_grader(question=question, answer=answer, expected=expected)
+    async def grade_all(max_concurrent: int = 5):
+        semaphore = asyncio.Semaphore(max_concurrent)
+        return await asyncio.gather(*[
+            math_grader.acall(question=q, answer=a, expected=e, semaphore=semaphore)
+            for q, a, e in questions
+        ])
+    
+    results = asyncio.run(grade_all())
+    
+    for (question, answer, expected), result in zip(questions, results):
         print(f"Q: {question}")
         print(f"A: {answer} -> Score: {result.score} ({result.choice})")
         if result.reasoning:
             print(f"Reasoning: {result.reasoning[:100]}...")
         print()
     
+    # Or grade all questions in a single request
+    batch_results = math_grader.batch(questions)
+    for (question, answer, expected), result in zip(questions, batch_results):
+        print(f"[batch] Q: {question} A: {answer} -> Score: {result.score} ({result.choice})")
+    print()
+    
     # Example 5: Predefined binary classifier
     print("=== Example 5: Predefined Binary Classifier ===")
     
@@ -92,5 +92,5 @@ def main():
     print(response)
 
 
-if __name__ == "main":
+if __name__ == "__main__":
     main()
\ No newline at end of file
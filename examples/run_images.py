@@ -48,5 +48,5 @@ def main():
 
     return data
 
-if __name__ == "main":
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """
 OCR Test - Testing new OCR wrapper functionality and enhanced features
+
+Run with pytest (the receipt is OCR'd once and shared across tests):
+    pytest examples/test_ocr.py
 """
 
+import pytest
 import aiwand
 from dotenv import load_dotenv
 
 load_dotenv()
 
+RECEIPT_IMAGE_URL = "https://bella.amankumar.ai/examples/receipt_1.jpeg"
+STATEMENT_DOC_URL = "https://bella.amankumar.ai/examples/bank-statements/info-indian-overseas-bank.pdf"
+OCR_MODEL = "gemini-2.0-flash-lite"
+
 expected_texts_1 = [
      "Liquor Street",
     "Tandoori chicken", 
@@ -19,25 +27,45 @@ expected_texts_1 = [
 ]
 
 
-def test_new_ocr_wrapper():
+def find_expected_texts(text, expected_texts):
+    """Split expected_texts into (found, missing), lowercasing text only once."""
+    text_lower = text.lower()
+    found, missing = [], []
+    for expected in expected_texts:
+        (found if expected.lower() in text_lower else missing).append(expected)
+    return found, missing
+
+
+def print_matches(expected_texts, found):
+    found = set(found)
+    for expected in expected_texts:
+        if expected in found:
+            print(f"   ✅ Found: '{expected}'")
+        else:
+            print(f"   ❌ Missing: '{expected}'")
+
+
+@pytest.fixture(scope="session")
+def receipt_ocr_text():
+    """OCR the sample receipt once and share the text across tests"""
+    return aiwand.ocr(images=[RECEIPT_IMAGE_URL], model=OCR_MODEL)
+
+
+def test_new_ocr_wrapper(receipt_ocr_text):
     """Test the new OCR wrapper functionality with expected words validation"""
     print("🆕 Testing New OCR Wrapper Features")
     print("=" * 50)
     
     # Sample image for testing
-    sample_image = "https://bella.amankumar.ai/examples/receipt_1.jpeg"
+    sample_image = RECEIPT_IMAGE_URL
     
     
     def validate_ocr_accuracy(text, test_name):
         """Helper function to validate OCR accuracy"""
         print(f"\n🔍 {test_name} Validation:")
-        matches = 0
-        for expected in expected_texts_1:
-            if expected.lower() in text.lower():
-                print(f"   ✅ Found: '{expected}'")
-                matches += 1
-            else:
-                print(f"   ❌ Missing: '{expected}'")
+        found, _ = find_expected_texts(text, expected_texts_1)
+        print_matches(expected_texts_1, found)
+        matches = len(found)
         
         accuracy = (matches / len(expected_texts_1)) * 100
         print(f"\n📊 {test_name} Accuracy: {accuracy:.1f}% ({matches}/{len(expected_texts_1)} items found)")
@@ -57,13 +85,7 @@ def test_new_ocr_wrapper():
         print("\n1️⃣ Testing ocr_call_ai() wrapper directly")
         print("-" * 40)
         
-        extracted_text = aiwand.ocr(
-            # user_prompt="Extract all text from this receipt image:",
-            images=[sample_image],
-            # additional_system_instructions="Focus on restaurant name, items, and total amount",
-            # temperature=0.05,  # Very low for consistent extraction
-            # debug=False  # Reduce debug output for cleaner test
-        )
+        extracted_text = receipt_ocr_text
         
         print(f"✅ ocr_call_ai Success! Extracted {len(extracted_text)} characters")
         print(f"📄 Extracted text: {extracted_text}...")
@@ -111,10 +133,8 @@ def test_new_ocr_wrapper():
         print(f"🤖 AI Analysis preview: {wrapper_integrated[:200]}...")
         
         # Check if the analysis contains expected restaurant info
-        restaurant_found = any(term.lower() in wrapper_integrated.lower() 
-                             for term in ["liquor street", "restaurant", "food", "receipt"])
-        total_found = any(term in wrapper_integrated.lower() 
-                         for term in ["1,139", "1139", "total", "amount"])
+        restaurant_found = bool(find_expected_texts(wrapper_integrated, ["liquor street", "restaurant", "food", "receipt"])[0])
+        total_found = bool(find_expected_texts(wrapper_integrated, ["1,139", "1139", "total", "amount"])[0])
         
         print(f"🔍 call_ai Integration Validation:")
         print(f"   Restaurant info detected: {'✅' if restaurant_found else '❌'}")
@@ -151,14 +171,14 @@ def test_new_ocr_wrapper():
         assert False
         
 
-def run_legacy_tests():
+def test_legacy_ocr(receipt_ocr_text):
     """Run focused legacy OCR tests"""
     print("\n🔄 Running Focused Legacy OCR Tests")
     print("=" * 40)
     
     # Sample image and document for testing  
-    sample_image = "https://bella.amankumar.ai/examples/receipt_1.jpeg"
-    statement_doc = "https://bella.amankumar.ai/examples/bank-statements/info-indian-overseas-bank.pdf"
+    sample_image = RECEIPT_IMAGE_URL
+    statement_doc = STATEMENT_DOC_URL
     
     print(f"📷 Testing with image: {sample_image}")
     print(f"🤖 Current provider: {aiwand.get_current_provider()}")
@@ -168,11 +188,7 @@ def run_legacy_tests():
         print("\n1️⃣ Standard OCR Function (using new wrapper internally)")
         print("-" * 50)
         
-        ocr_result = aiwand.ocr(
-            images=[sample_image],
-            model="gemini-2.0-flash-lite",
-            debug=False
-        )
+        ocr_result = receipt_ocr_text
         
         legacy_success = False
         if ocr_result:
@@ -181,13 +197,9 @@ def run_legacy_tests():
             
             # Validate OCR accuracy
             print(f"\n🔍 Standard OCR Validation:")
-            matches = 0
-            for expected in expected_texts_1:
-                if expected.lower() in ocr_result.lower():
-                    print(f"   ✅ Found: '{expected}'")
-                    matches += 1
-                else:
-                    print(f"   ❌ Missing: '{expected}'")
+            found, _ = find_expected_texts(ocr_result, expected_texts_1)
+            print_matches(expected_texts_1, found)
+            matches = len(found)
             
             accuracy = (matches / len(expected_texts_1)) * 100
             print(f"\n📊 Standard OCR Accuracy: {accuracy:.1f}% ({matches}/{len(expected_texts_1)} items found)")
@@ -250,14 +262,17 @@ Output the extracted text clearly and accurately.
         )
         print(d1)
 
-        d2 = aiwand.call_ai(
+        # Stream the answer so output starts printing as soon as it's generated
+        for chunk in aiwand.call_ai(
             document_links=[statement_doc],
             # images=[sample_image],
             model="gemini-2.5-flash-lite",
             debug=True,
             system_prompt="what is this total amount",
-        )
-        print(d2)
+            stream=True
+        ):
+            print(chunk, end="", flush=True)
+        print()
 
         doc_result = aiwand.ocr(
             document_links=[statement_doc],
@@ -279,13 +294,9 @@ Output the extracted text clearly and accurately.
             
             # Validate document OCR accuracy  
             print(f"\n🔍 Document OCR Validation:")
-            doc_matches = 0
-            for expected in statement_expected_texts:
-                if expected.lower() in extracted_doc_text.lower():
-                    print(f"   ✅ Found: '{expected}'")
-                    doc_matches += 1
-                else:
-                    print(f"   ❌ Missing: '{expected}'")
+            found, _ = find_expected_texts(extracted_doc_text, statement_expected_texts)
+            print_matches(statement_expected_texts, found)
+            doc_matches = len(found)
             
             doc_accuracy = (doc_matches / len(statement_expected_texts)) * 100
             print(f"\n📊 Document OCR Accuracy: {doc_accuracy:.1f}% ({doc_matches}/{len(statement_expected_texts)} items found)")
@@ -326,14 +337,25 @@ def main():
     print("🧪 AIWand OCR Test Suite (Enhanced)")
     print("=" * 50)
     
+    # OCR the sample receipt once for both test groups
+    receipt_text = aiwand.ocr(images=[RECEIPT_IMAGE_URL], model=OCR_MODEL)
+    
     # Test new wrapper functionality first
-    wrapper_success = test_new_ocr_wrapper()
+    try:
+        test_new_ocr_wrapper(receipt_text)
+        wrapper_success = True
+    except AssertionError:
+        wrapper_success = False
     
     if not wrapper_success:
         print("⚠️  New wrapper tests failed, but continuing with legacy tests...")
     
     # Run legacy tests
-    legacy_success = run_legacy_tests()
+    try:
+        test_legacy_ocr(receipt_text)
+        legacy_success = True
+    except AssertionError:
+        legacy_success = False
     
     # Final comprehensive summary
     print("\n" + "="*60)
@@ -375,5 +397,5 @@ def main():
     
     assert overall_success
 
-# if __name__ == "__main__":
-    # main()
+if __name__ == "__main__":
+    main()
@@ -20,5 +20,5 @@ def main():
     for path in test_paths:
         print(f"{path:<45} -> {'REMOTE' if aiwand.is_remote_url(path) else 'LOCAL'}")
 
-if __name__ == 'main':
+if __name__ == '__main__':
     main()
@@ -15,14 +15,15 @@ import re
 from pathlib import Path
 
 
+# Matches __version__ = "x.y.z" with either quote style
+VERSION_RE = re.compile(r'(__version__\s*=\s*)(["\'])(.+?)\2')
+
+
 def get_current_version():
     """Get current version from __init__.py"""
-    init_path = Path("src/aiwand/__init__.py")
-    with open(init_path, "r") as f:
-        content = f.read()
-        match = re.search(r'__version__ = ["\'](.+)["\']', content)
-        if match:
-            return match.group(1)
+    match = VERSION_RE.search(Path("src/aiwand/__init__.py").read_text())
+    if match:
+        return match.group(3)
     raise RuntimeError("Version not found in __init__.py")
 
 
@@ -42,14 +43,15 @@ def bump_version(current_version, bump_type):
 
 def update_version_in_file(file_path, old_version, new_version):
     """Update version in a file"""
-    with open(file_path, "r") as f:
-        content = f.read()
+    path = Path(file_path)
+    content = path.read_text()
     
-    content = content.replace(f'__version__ = "{old_version}"', f'__version__ = "{new_version}"')
-    content = content.replace(f"__version__ = '{old_version}'", f"__version__ = '{new_version}'")
+    def replace(match):
+        if match.group(3) != old_version:
+            return match.group(0)
+        return f"{match.group(1)}{match.group(2)}{new_version}{match.group(2)}"
     
-    with open(file_path, "w") as f:
-        f.write(content)
+    path.write_text(VERSION_RE.sub(replace, content, count=1))
 
 
 def main():
@@ -9,23 +9,30 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_command(cmd, description):
-    """Run a command and handle errors"""
+    """Run a command (argv list) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return result
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"Command: {cmd}")
+        print(f"Command: {' '.join(cmd)}")
         print(f"Error: {e.stderr}")
         sys.exit(1)
 
 
+def is_tool_installed(module):
+    """Check if a python module can be run with `python -m <module> --version`"""
+    result = subprocess.run([sys.executable, "-m", module, "--version"], capture_output=True)
+    return result.returncode == 0
+
+
 def get_current_version():
     """Get current version from __init__.py"""
     init_path = Path("src/aiwand/__init__.py")
@@ -40,7 +47,7 @@ def get_current_version():
 
 def check_git_status():
     """Check if git working directory is clean"""
-    result = subprocess.run("git status --porcelain", shell=True, capture_output=True, text=True)
+    result = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
     if result.stdout.strip():
         print("❌ Git working directory is not clean. Please commit your changes first.")
         print("Uncommitted changes:")
@@ -69,13 +76,12 @@ def main():
     # Check git status
     check_git_status()
     
-    # Check if build and twine are installed
-    try:
-        subprocess.run("python -m build --version", shell=True, check=True, capture_output=True)
-        subprocess.run("python -m twine --version", shell=True, check=True, capture_output=True)
-    except subprocess.CalledProcessError:
+    # Check if build and twine are installed (both checks run concurrently)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tools_installed = all(executor.map(is_tool_installed, ["build", "twine"]))
+    if not tools_installed:
         print("❌ build and twine are required. Installing...")
-        run_command("pip install build twine", "Installing build tools")
+        run_command([sys.executable, "-m", "pip", "install", "build", "twine"], "Installing build tools")
     
     # Clean previous builds
     if Path("dist").exists():
@@ -89,10 +95,10 @@ def main():
         shutil.rmtree(egg_info)
     
     # Run tests
-    run_command("python test_install.py", "Running installation tests")
+    run_command([sys.executable, "test_install.py"], "Running installation tests")
     
     # Build the package
-    run_command("python -m build", "Building package")
+    run_command([sys.executable, "-m", "build"], "Building package")
     
     # Check if dist files were created
     dist_files = list(Path("dist").glob("*"))
@@ -117,14 +123,17 @@ def main():
         sys.exit(0)
     
     # Upload to PyPI
-    run_command("python -m twine upload dist/*", "Uploading to PyPI")
+    run_command(
+        [sys.executable, "-m", "twine", "upload", *[str(file) for file in dist_files]],
+        "Uploading to PyPI"
+    )
     
     # Create git tag
-    run_command(f"git tag v{version}", f"Creating git tag v{version}")
+    run_command(["git", "tag", f"v{version}"], f"Creating git tag v{version}")
     
     # Push to GitHub
-    run_command("git push", "Pushing to GitHub")
-    run_command("git push --tags", "Pushing tags to GitHub")
+    run_command(["git", "push"], "Pushing to GitHub")
+    run_command(["git", "push", "--tags"], "Pushing tags to GitHub")
     
     print("\n🎉 Publishing completed successfully!")
     print(f"✅ Version {version} is now live on PyPI")
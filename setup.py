@@ -46,6 +46,7 @@ setup(
         "python-dotenv>=0.19.0",
         "beautifulsoup4>=4.0",
         "google-genai>=1.20.0",
+        "certifi",
     ],
     extras_require={
         "dev": [
@@ -53,6 +54,13 @@ setup(
             "black>=21.0",
             "flake8>=3.8",
         ],
+        "fast": [
+            "orjson>=3.6",
+            "numpy>=1.21",
+        ],
+        "semantic": [
+            "sentence-transformers>=2.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,10 +5,24 @@ AIWand - A simple AI toolkit for text processing using OpenAI and Gemini
 __version__ = "0.4.37"
 __author__ = "Aman Kumar"
 
-from .core import summarize, chat, generate_text
-from .extract import extract
+from .core import (
+    summarize,
+    chat,
+    generate_text,
+    asummarize,
+    achat,
+    agenerate_text,
+    summarize_batch,
+    asummarize_batch,
+    chat_batch,
+    achat_batch,
+    generate_text_batch,
+    agenerate_text_batch,
+)
+from .extract import extract, aextract, extract_batch, aextract_batch
 from .config import (
     call_ai,
+    acall_ai,
     get_ai_client,
     list_models,
     ocr,
@@ -52,9 +66,25 @@ from .utils import (
     image_to_data_url,
     document_to_data_url,
 )
+from .parallel import (
+    run_parallel,
+    arun_parallel,
+    StatusTracker,
+)
+from .cache import (
+    ResponseCache,
+    SemanticCache,
+)
+from .instrumentation import set_stage_callback
 from .classifier import (
     ClassifierResponse,
+    ClassifierBatchResult,
+    SemanticClassifierCache,
     classify_text,
+    aclassify_text,
+    classify_batch,
+    classify_many,
+    aclassify_many,
     create_classifier,
     create_binary_classifier,
     create_quality_classifier,
@@ -67,9 +97,24 @@ __all__ = [
     "generate_text",
     "extract",
     "call_ai",
+    "acall_ai",
+    "asummarize",
+    "achat",
+    "agenerate_text",
+    "aextract",
     "ocr",    
     "process_single_ocr",
 
+    # Batch processing
+    "summarize_batch",
+    "asummarize_batch",
+    "chat_batch",
+    "achat_batch",
+    "generate_text_batch",
+    "agenerate_text_batch",
+    "extract_batch",
+    "aextract_batch",
+
     # Configuration and setup
     "setup_user_preferences",
     "show_current_config",
@@ -105,11 +150,29 @@ __all__ = [
        
     # Classification
     "ClassifierResponse",
+    "ClassifierBatchResult",
+    "SemanticClassifierCache",
     "classify_text",
+    "aclassify_text",
+    "classify_batch",
+    "classify_many",
+    "aclassify_many",
     "create_classifier", 
     "create_binary_classifier",
     "create_quality_classifier",
     
+    # Parallel execution
+    "run_parallel",
+    "arun_parallel",
+    "StatusTracker",
+
+    # Caching
+    "ResponseCache",
+    "SemanticCache",
+
+    # Instrumentation
+    "set_stage_callback",
+
     # Configuration
     "AIError",
     "DEFAULT_SYSTEM_PROMPT",
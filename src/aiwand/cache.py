@@ -0,0 +1,370 @@
+"""
+Response caching for AIWand.
+
+This module provides a persistent exact-match cache for AI responses, stored
+in a SQLite database inside the AIWand configuration directory.
+
+Caching is opt-in: set the AIWAND_CACHE environment variable to "1" to enable
+it for call_ai, or pass bypass_cache=True to skip it for a single call. Set
+AIWAND_CACHE_TTL to a number of seconds to expire entries (default: never).
+
+SemanticCache is an in-memory cache that also answers paraphrased inputs; pass
+one as semantic_cache to summarize, chat, generate_text or extract.
+"""
+
+import os
+import time
+import bisect
+import asyncio
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+from pydantic import BaseModel
+
+from .preferences import get_config_dir
+from .utils.json_utils import json_dumps, json_loads
+from .utils.llm_utils import get_json_schema
+
+
+CACHE_ENV_VAR = "AIWAND_CACHE"
+CACHE_TTL_ENV_VAR = "AIWAND_CACHE_TTL"
+
+T = TypeVar("T")
+
+
+def is_cache_enabled() -> bool:
+    """Check whether response caching is enabled via the AIWAND_CACHE env var."""
+    return os.getenv(CACHE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _cache_ttl() -> Optional[float]:
+    """Read the default cache TTL in seconds from AIWAND_CACHE_TTL, or None if unset."""
+    value = os.getenv(CACHE_TTL_ENV_VAR, "").strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{CACHE_TTL_ENV_VAR} must be a number of seconds, got {value!r}")
+
+
+def _normalize(value: Any) -> Any:
+    """Convert a request value into a JSON-serializable, stable representation."""
+    if isinstance(value, bytes):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        return get_json_schema(value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def make_cache_key(request: Dict[str, Any]) -> str:
+    """
+    Build a cache key from the parts of a request that affect the response.
+
+    Args:
+        request: Mapping of request parameters (model, messages, temperature, ...)
+
+    Returns:
+        str: SHA-256 hex digest of the normalized request
+    """
+    normalized = json_dumps(_normalize(request), sort_keys=True)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def dump_response(value: Any) -> Optional[str]:
+    """Serialize a call_ai result for caching. Returns None if it can't be cached."""
+    if isinstance(value, str):
+        return json_dumps({"text": value})
+    if isinstance(value, BaseModel):
+        return json_dumps({"model": value.model_dump(mode="json")})
+    return None
+
+
+def load_response(data: str, response_format: Optional[Any] = None) -> Any:
+    """Deserialize a cached call_ai result produced by dump_response."""
+    payload = json_loads(data)
+    if "model" in payload and response_format is not None:
+        return response_format.model_validate(payload["model"])
+    return payload.get("text")
+
+
+class ResponseCache:
+    """Persistent key/value cache for AI responses backed by SQLite."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            path: Path to the SQLite file (default: ~/.aiwand/cache.sqlite)
+            ttl: Optional time-to-live in seconds. Entries older than this are ignored.
+        """
+        self.path = Path(path).expanduser() if path else get_config_dir() / "cache.sqlite"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            # WAL lets concurrent readers (threads or processes) proceed while a write is in progress
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return None
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, replacing any existing entry."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared default response cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    # Read on every use, like AIWAND_CACHE, so the TTL can be changed at runtime
+    _default_cache.ttl = _cache_ttl()
+    return _default_cache
+
+
+class SemanticCache:
+    """
+    In-memory cache that reuses AI results for identical or paraphrased inputs.
+    
+    Lookups try an exact match on the input text first, then fall back to the
+    most similar cached input embedded with a local sentence-transformers
+    model, accepting it when cosine similarity >= threshold. Entries are
+    grouped by namespace, so results are only shared between calls made with
+    the same settings (model, system prompt, temperature, ...).
+    
+    Requires the optional `sentence-transformers` package.
+    
+    Example:
+        cache = SemanticCache(threshold=0.95, ttl=3600)
+        summarize(text, semantic_cache=cache)
+        summarize(text, semantic_cache=cache)  # cache hit, no API call
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        max_entries: int = 10000,
+        ttl: Optional[float] = 1800,
+        max_temperature: Optional[float] = 0.7
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a cache hit (0.0 to 1.0)
+            model_name: sentence-transformers model used for embeddings
+            max_entries: Maximum number of cached items per namespace
+            ttl: Seconds an entry stays valid, or None to keep entries until evicted
+            max_temperature: Calls with a higher temperature bypass the cache, since
+                their responses are meant to vary. The default covers AIWand's default
+                temperature (0.7); None caches at any temperature.
+        """
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self._encoder = None
+        self._exact: Dict[str, Dict[bytes, Tuple[Any, float]]] = {}
+        self._entries: Dict[str, Tuple[Any, List[Any], List[float]]] = {}
+        self._lock = threading.Lock()
+    
+    def _embed(self, text: str):
+        """Embed text into a normalized vector, loading the model on first use."""
+        if self._encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    f"{type(self).__name__} requires sentence-transformers. "
+                    "Install it with: pip install sentence-transformers"
+                )
+            self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode([text], normalize_embeddings=True)[0]
+    
+    def _is_fresh(self, created_at: float) -> bool:
+        return self.ttl is None or time.time() - created_at <= self.ttl
+    
+    def _first_fresh(self, created: List[float]) -> int:
+        """Index of the first unexpired row; rows are stored oldest first."""
+        if self.ttl is None:
+            return 0
+        return bisect.bisect_left(created, time.time() - self.ttl)
+    
+    def _lookup_exact(self, namespace: str, digest: bytes) -> Optional[Any]:
+        with self._lock:
+            entry = self._exact.get(namespace, {}).get(digest)
+        if entry is not None and self._is_fresh(entry[1]):
+            return entry[0]
+        return None
+    
+    def _lookup_similar(self, namespace: str, embedding) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(namespace)
+        if entry is None:
+            return None
+        
+        embeddings, responses, created = entry
+        # Only compare against unexpired rows, so a stale copy never shadows a fresh one
+        start = self._first_fresh(created)
+        if start == len(created):
+            return None
+        similarities = embeddings[start:] @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] >= self.threshold:
+            return responses[start + best]
+        return None
+    
+    def _store(self, namespace: str, digest: bytes, embedding, response: Any) -> None:
+        import numpy as np
+        
+        now = time.time()
+        with self._lock:
+            exact = self._exact.setdefault(namespace, {})
+            # Re-insert so a refreshed entry moves to the end of the eviction order
+            exact.pop(digest, None)
+            exact[digest] = (response, now)
+            if len(exact) > self.max_entries:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del exact[next(iter(exact))]
+            embeddings, responses, created = self._entries.get(namespace, (None, [], []))
+            # Drop expired rows, which are always the oldest ones
+            start = self._first_fresh(created)
+            if start:
+                embeddings, responses, created = embeddings[start:], responses[start:], created[start:]
+                if not created:
+                    embeddings = None
+            if embeddings is None:
+                embeddings = embedding[np.newaxis, :]
+            else:
+                embeddings = np.vstack([embeddings, embedding])[-self.max_entries:]
+            responses = (responses + [response])[-self.max_entries:]
+            created = (created + [now])[-self.max_entries:]
+            self._entries[namespace] = (embeddings, responses, created)
+    
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+    
+    def accepts(self, temperature: Optional[float]) -> bool:
+        """Whether calls made at this temperature should use the cache."""
+        return temperature is None or self.max_temperature is None or temperature <= self.max_temperature
+    
+    def lookup(self, text: str, namespace: str) -> Optional[Any]:
+        """Return the cached response for text (or the most similar text), if any."""
+        cached = self._lookup_exact(namespace, self._digest(text))
+        if cached is not None:
+            return cached
+        return self._lookup_similar(namespace, self._embed(text))
+    
+    def add(self, text: str, namespace: str, response: Any) -> None:
+        """Store a response for text under the given namespace."""
+        self._store(namespace, self._digest(text), self._embed(text), response)
+    
+    def get_or_call(
+        self,
+        text: str,
+        namespace: str,
+        call: Callable[[], T],
+        temperature: Optional[float] = None
+    ) -> T:
+        """
+        Return the cached response for text, or run call and cache its result.
+        
+        Args:
+            text: Input compared against previous inputs (usually the user prompt)
+            namespace: Settings the response depends on besides text
+            call: Function producing the response on a cache miss
+            temperature: Sampling temperature of the call; see max_temperature
+        """
+        if not self.accepts(temperature):
+            return call()
+        
+        digest = self._digest(text)
+        cached = self._lookup_exact(namespace, digest)
+        if cached is not None:
+            return cached
+        embedding = self._embed(text)
+        cached = self._lookup_similar(namespace, embedding)
+        if cached is not None:
+            return cached
+        
+        response = call()
+        self._store(namespace, digest, embedding, response)
+        return response
+    
+    async def aget_or_call(
+        self,
+        text: str,
+        namespace: str,
+        call: Callable[[], Awaitable[T]],
+        temperature: Optional[float] = None
+    ) -> T:
+        """
+        Async version of get_or_call, for a call returning an awaitable.
+        Embedding (and loading the model on first use) runs in a worker thread.
+        """
+        if not self.accepts(temperature):
+            return await call()
+        
+        digest = self._digest(text)
+        cached = self._lookup_exact(namespace, digest)
+        if cached is not None:
+            return cached
+        embedding = await asyncio.to_thread(self._embed, text)
+        cached = self._lookup_similar(namespace, embedding)
+        if cached is not None:
+            return cached
+        
+        response = await call()
+        self._store(namespace, digest, embedding, response)
+        return response
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._exact.clear()
+            self._entries.clear()
@@ -5,11 +5,26 @@ This module provides a simplified classifier that can be used to grade or classi
 text responses based on custom criteria and choice scores.
 """
 
-from typing import Dict, Optional, Any, Union
-from pydantic import BaseModel, Field
+import asyncio
+import hashlib
+from functools import lru_cache
+from array import array
+from collections.abc import Sequence
+from typing import Annotated, Dict, List, Literal, NamedTuple, Optional, Any, Tuple, Type, Union
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, ValidationError, computed_field, create_model
 
-from .config import call_ai, AIError, ModelType
+from .cache import SemanticCache
+from .config import call_ai, acall_ai, AIError, ModelType, _run_async
 from .models import AIProvider
+from .utils.json_utils import json_dumps
+
+
+# Short JSON keys used in classifier responses. Every key is emitted once per
+# graded item, so single-letter names save output tokens (mostly in batches).
+_REASONING_KEY = "a"
+_GRADE_KEY = "b"
+_INDEX_KEY = "i"
+_RESPONSE_MODEL_CONFIG = ConfigDict(populate_by_name=True)
 
 
 class ClassifierResponse(BaseModel):
@@ -20,11 +35,173 @@ class ClassifierResponse(BaseModel):
     reasoning: str = Field(default="", description="Reasoning behind the choice")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Add reasoning to metadata for compatibility
-        if self.reasoning and "rationale" not in self.metadata:
-            self.metadata["rationale"] = self.reasoning
+    @computed_field
+    @property
+    def rationale(self) -> str:
+        """Alias of reasoning, for compatibility with autoevals-style consumers."""
+        return self.reasoning
+
+
+class ClassifierBatchResult(Sequence):
+    """
+    Column-wise results from classify_batch.
+    
+    Scores, choices and reasonings are kept in parallel columns (scores in a
+    compact float array, choices as small integer ids into choice_vocab)
+    instead of one ClassifierResponse per item, which keeps large batches small
+    in memory. Indexing or iterating builds ClassifierResponse objects on
+    demand, so it can be used like a list.
+    
+    Aggregations (mean, histogram, filter) run in NumPy when it is installed.
+    """
+    
+    __slots__ = ("scores", "choice_ids", "choice_vocab", "reasonings", "metadata", "_choice_index")
+    
+    def __init__(self, metadata: Optional[Dict[str, Any]] = None):
+        self.scores = array("d")
+        self.choice_ids = array("h")
+        self.choice_vocab: List[str] = []
+        self.reasonings: List[str] = []
+        self.metadata: Dict[str, Any] = metadata or {}
+        self._choice_index: Dict[str, int] = {}
+        for choice in self.metadata.get("choices_available") or []:
+            self._choice_id(choice)
+    
+    def _choice_id(self, choice: str) -> int:
+        choice_id = self._choice_index.get(choice)
+        if choice_id is None:
+            choice_id = len(self.choice_vocab)
+            self._choice_index[choice] = choice_id
+            self.choice_vocab.append(choice)
+        return choice_id
+    
+    def append(self, score: float, choice: str, reasoning: str = "") -> None:
+        """Add one classified item."""
+        self.scores.append(score)
+        self.choice_ids.append(self._choice_id(choice))
+        self.reasonings.append(reasoning)
+    
+    @property
+    def choices(self) -> List[str]:
+        """Choice selected for each item."""
+        return [self.choice_vocab[i] for i in self.choice_ids]
+    
+    def scores_array(self):
+        """Scores as a NumPy array (a zero-copy view over the score column)."""
+        np = _require_numpy()
+        return np.frombuffer(self.scores, dtype=np.float64)
+    
+    def mean(self) -> float:
+        """Mean score across all items (nan if empty)."""
+        if not self.scores:
+            return float("nan")
+        return float(self.scores_array().mean())
+    
+    def histogram(self) -> Dict[str, int]:
+        """Number of items per choice, including choices that were never selected."""
+        np = _require_numpy()
+        counts = np.bincount(
+            np.frombuffer(self.choice_ids, dtype=np.int16),
+            minlength=len(self.choice_vocab)
+        )
+        return dict(zip(self.choice_vocab, counts.tolist()))
+    
+    def filter(
+        self,
+        score_gte: Optional[float] = None,
+        score_lte: Optional[float] = None,
+        choice: Optional[str] = None
+    ) -> "ClassifierBatchResult":
+        """
+        Select items by score range and/or choice.
+        
+        Args:
+            score_gte: Keep items with score >= this value
+            score_lte: Keep items with score <= this value
+            choice: Keep items with this choice
+            
+        Returns:
+            A new ClassifierBatchResult with the matching items, in order
+        """
+        np = _require_numpy()
+        scores = self.scores_array()
+        mask = np.ones(len(scores), dtype=bool)
+        if score_gte is not None:
+            mask &= scores >= score_gte
+        if score_lte is not None:
+            mask &= scores <= score_lte
+        if choice is not None:
+            choice_ids = np.frombuffer(self.choice_ids, dtype=np.int16)
+            mask &= choice_ids == self._choice_index.get(choice, -1)
+        
+        selected = ClassifierBatchResult(metadata=self.metadata)
+        for i in np.flatnonzero(mask).tolist():
+            selected.append(self.scores[i], self.choice_vocab[self.choice_ids[i]], self.reasonings[i])
+        return selected
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ClassifierResponse(
+            score=self.scores[index],
+            choice=self.choice_vocab[self.choice_ids[index]],
+            reasoning=self.reasonings[index],
+            metadata=dict(self.metadata)
+        )
+    
+    def __repr__(self) -> str:
+        return f"ClassifierBatchResult(items={len(self)})"
+
+
+def _require_numpy():
+    """Import numpy, raising a helpful error if it is not installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "ClassifierBatchResult aggregations require numpy. "
+            "Install it with: pip install numpy"
+        )
+    return np
+
+
+class SemanticClassifierCache(SemanticCache):
+    """
+    In-memory cache that reuses classifier results for paraphrased inputs.
+    
+    Each (question, answer, expected) item is embedded with a local
+    sentence-transformers model, and a cached ClassifierResponse is returned
+    when a previous item graded with the same settings has cosine
+    similarity >= threshold.
+    
+    Requires the optional `sentence-transformers` package.
+    
+    Example:
+        cache = SemanticClassifierCache(threshold=0.9)
+        classify_text(question="What color is the sky?", answer="Blue", semantic_cache=cache)
+        classify_text(question="What is the sky's color?", answer="Blue", semantic_cache=cache)  # cache hit
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.90,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        max_entries: int = 10000
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a cache hit (0.0 to 1.0)
+            model_name: sentence-transformers model used for embeddings
+            max_entries: Maximum number of cached items per classifier configuration
+        """
+        # Grades are deterministic for a given configuration, so entries never expire
+        super().__init__(
+            threshold=threshold, model_name=model_name, max_entries=max_entries,
+            ttl=None, max_temperature=None
+        )
 
 
 def classify_text(
@@ -36,7 +213,9 @@ def classify_text(
     system_msg: str = "",
     use_reasoning: bool = True,
     model: Optional[ModelType] = None,
-    provider: Optional[Union[AIProvider, str]] = None
+    provider: Optional[Union[AIProvider, str]] = None,
+    semantic_cache: Optional[SemanticClassifierCache] = None,
+    max_retries: int = 2
 ) -> ClassifierResponse:
     """
     Classify or grade text based on custom criteria.
@@ -44,6 +223,9 @@ def classify_text(
     This function provides a simple interface for text classification and grading
     that's inspired by autoevals but integrated with AIWand's provider system.
     
+    When the AIWAND_CACHE environment variable is set, identical classification
+    requests are answered from the on-disk response cache without an API call.
+    
     Args:
         question: The question, prompt, or context
         answer: The response to be evaluated
@@ -54,6 +236,9 @@ def classify_text(
         use_reasoning: Whether to include step-by-step reasoning
         model: Specific model to use
         provider: Specific provider to use
+        semantic_cache: Optional SemanticClassifierCache to reuse results for similar inputs
+        max_retries: Times to re-ask the model, with the validation error, when it returns
+            an invalid grade
         
     Returns:
         ClassifierResponse with score, choice, reasoning, and metadata
@@ -80,10 +265,65 @@ def classify_text(
             use_reasoning=True
         )
     """
+    prepared = _prepare_classification(
+        question, answer, expected, prompt_template, choice_scores, system_msg, use_reasoning, model, provider
+    )
+    if semantic_cache is not None:
+        cached = semantic_cache.lookup(prepared.cache_text, prepared.cache_namespace)
+        if cached is not None:
+            return cached
+    
+    try:
+        messages = [{"role": "user", "content": prepared.user_prompt}]
+        for attempt in range(max_retries + 1):
+            try:
+                result = call_ai(messages=messages, **prepared.call_kwargs)
+                grade = _resolve_grade(result.grade, prepared.choice_scores)
+                break
+            except AIError as e:
+                feedback = _invalid_grade_feedback(e, prepared.choice_scores)
+                if feedback is None or attempt == max_retries:
+                    raise
+                # Ask again for the same item, showing the model its answer and what was wrong
+                messages = messages + feedback
+        
+        response = _classifier_response(prepared, result, grade, use_reasoning, model, provider)
+        if semantic_cache is not None:
+            semantic_cache.add(prepared.cache_text, prepared.cache_namespace, response)
+        return response
+        
+    except AIError:
+        raise
+    except Exception as e:
+        raise AIError(f"Classification failed: {str(e)}")
+
+
+class _PreparedClassification(NamedTuple):
+    """What classify_text/aclassify_text work out once per item, before calling the model."""
+    choice_scores: Dict[str, float]
+    user_prompt: str
+    # call_ai arguments besides messages
+    call_kwargs: Dict[str, Any]
+    cache_text: str
+    cache_namespace: str
+
+
+def _prepare_classification(
+    question: str,
+    answer: str,
+    expected: str,
+    prompt_template: str,
+    choice_scores: Optional[Dict[str, float]],
+    system_msg: str,
+    use_reasoning: bool,
+    model: Optional[ModelType],
+    provider: Optional[Union[AIProvider, str]]
+) -> _PreparedClassification:
+    """Validate the inputs of a single classification and build its request."""
     # Validate inputs
-    if not question.strip():
+    if not question or question.isspace():
         raise ValueError("question cannot be empty")
-    if not answer.strip():
+    if not answer or answer.isspace():
         raise ValueError("answer cannot be empty")
     
     # Default choice scores if not provided
@@ -93,90 +333,422 @@ def classify_text(
     if not choice_scores:
         raise ValueError("choice_scores cannot be empty")
     
-    # Build system prompt components
-    base_system_msg = system_msg if system_msg.strip() else "You are an AI classifier and grader. Evaluate responses according to the given criteria."
+    system_prompt = _build_system_prompt(
+        system_msg, prompt_template, tuple(choice_scores), use_reasoning, bool(expected) and not expected.isspace()
+    )
+    return _PreparedClassification(
+        choice_scores=choice_scores,
+        user_prompt=_build_user_prompt(question, answer, expected),
+        # Use structured output. Invalid responses are re-asked by the caller with feedback,
+        # so call_ai raises them right away; network and rate limit errors are still retried
+        call_kwargs=dict(
+            system_prompt=system_prompt,
+            response_format=_get_classifier_model(use_reasoning, tuple(choice_scores)),
+            model=model,
+            provider=provider,
+            prompt_cache_key=_prompt_cache_key(system_prompt),
+            retry_invalid_responses=False
+        ),
+        cache_text=f"{question}||{answer}||{expected}",
+        cache_namespace=repr((
+            prompt_template, system_msg, use_reasoning,
+            tuple(sorted(choice_scores.items())), str(model), str(provider)
+        ))
+    )
+
+
+def _classifier_response(
+    prepared: _PreparedClassification,
+    result: Any,
+    grade: str,
+    use_reasoning: bool,
+    model: Optional[ModelType],
+    provider: Optional[Union[AIProvider, str]]
+) -> ClassifierResponse:
+    """Build the ClassifierResponse for a validated grade."""
+    return ClassifierResponse(
+        score=prepared.choice_scores[grade],
+        choice=grade,
+        reasoning=getattr(result, 'reasoning', '') if use_reasoning else '',
+        metadata={
+            "model": str(model) if model else None,
+            "provider": str(provider) if provider else None,
+            "choices_available": list(prepared.choice_scores.keys()),
+            "choice_scores": prepared.choice_scores
+        }
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_system_prompt(
+    system_msg: str,
+    prompt_template: str,
+    choices: Tuple[str, ...],
+    use_reasoning: bool,
+    has_expected: bool
+) -> str:
+    """
+    Build the grading system prompt shared by single and batch classification.
+    
+    The prompt only depends on the classifier settings, so it is built once per
+    configuration and reused across calls.
+    """
+    base_system_msg = system_msg if system_msg and not system_msg.isspace() else "You are an AI classifier and grader. Evaluate responses according to the given criteria."
     
     # Add evaluation logic from prompt_template to system prompt
-    evaluation_logic = ""
     if prompt_template.strip():
         evaluation_logic = f"\nEvaluation Criteria: {prompt_template.strip()}"
+    elif has_expected:
+        evaluation_logic = "\nEvaluation Criteria: Compare the given answer to the expected answer and evaluate how well they match."
     else:
-        # Default evaluation logic
-        if expected.strip():
-            evaluation_logic = "\nEvaluation Criteria: Compare the given answer to the expected answer and evaluate how well they match."
-        else:
-            evaluation_logic = "\nEvaluation Criteria: Evaluate the quality and appropriateness of the answer to the question."
+        evaluation_logic = "\nEvaluation Criteria: Evaluate the quality and appropriateness of the answer to the question."
     
     # Available choices (only names, not scores)
-    available_choices = ", ".join(choice_scores.keys())
+    available_choices = ", ".join(choices)
     
-    # Complete system prompt
-    system_prompt = f"""{base_system_msg}
+    return f"""{base_system_msg}
 
 {evaluation_logic}
 
 Available grades: {available_choices}
 
-{"Provide your step-by-step reasoning in the 'reasoning' field, then your final grade in the 'grade' field." if use_reasoning else "Provide your final grade in the 'grade' field."}
+{f"Provide your step-by-step reasoning in the '{_REASONING_KEY}' field, then your final grade in the '{_GRADE_KEY}' field." if use_reasoning else f"Provide your final grade in the '{_GRADE_KEY}' field."}
 
 Your grade must be exactly one of the specified options."""
+
+
+@lru_cache(maxsize=128)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """
+    Provider prompt cache key for a grading system prompt.
     
-    # Create user prompt (clean, without choice scores)
-    user_prompt_parts = [f"Question: {question}", f"Answer: {answer}"]
-    if expected.strip():
-        user_prompt_parts.append(f"Expected: {expected}")
+    The system prompt comes first and the per-item question/answer last, so
+    every call with the same settings shares the same prompt prefix.
+    """
+    return "aiwand-classifier-" + hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _build_user_prompt(question: str, answer: str, expected: str = "") -> str:
+    """
+    Build the user prompt for a single item (clean, without choice scores).
     
-    user_prompt = "\n".join(user_prompt_parts)
+    Item text is only ever interpolated as values, never used as a format
+    string, so braces in questions or answers are passed through untouched.
+    """
+    if expected and not expected.isspace():
+        return f"Question: {question}\nAnswer: {answer}\nExpected: {expected}"
+    return f"Question: {question}\nAnswer: {answer}"
+
+
+def _grade_fields(use_reasoning: bool, choices: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Field definitions for the reasoning/grade part of a classifier response.
     
-    # Create dynamic response model
+    The grade is a Literal of the available choices, so providers with
+    structured output constrain it to a valid choice. Grades that differ only
+    in case are normalized during validation for providers that don't.
+    """
+    available_choices = ", ".join(choices)
+    lookup = _grade_lookup(choices)
+    grade_type = Annotated[
+        Literal[choices],
+        BeforeValidator(lambda value: lookup.get(str(value).strip().casefold(), value))
+    ]
+    fields: Dict[str, Any] = {}
     if use_reasoning:
-        class DynamicClassifierModel(BaseModel):
-            reasoning: str = Field(description="Step-by-step analysis and reasoning")
-            grade: str = Field(description=f"Final grade, must be one of: {available_choices}")
+        fields["reasoning"] = (str, Field(alias=_REASONING_KEY, description="Step-by-step analysis and reasoning"))
+    fields["grade"] = (grade_type, Field(alias=_GRADE_KEY, description=f"Final grade, must be one of: {available_choices}"))
+    return fields
+
+
+@lru_cache(maxsize=256)
+def _get_classifier_model(use_reasoning: bool, choices: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Response model for a single classification.
+    
+    The model only depends on use_reasoning and the available choices, so it is
+    built once per combination instead of on every call.
+    """
+    return create_model(
+        "DynamicClassifierModel",
+        __config__=_RESPONSE_MODEL_CONFIG,
+        **_grade_fields(use_reasoning, choices)
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_batch_model(use_reasoning: bool, choices: Tuple[str, ...]) -> Type[BaseModel]:
+    """Response model for batch classification (one entry per numbered item)."""
+    item_model = create_model(
+        "DynamicBatchItemModel",
+        __config__=_RESPONSE_MODEL_CONFIG,
+        index=(int, Field(alias=_INDEX_KEY, description="Number of the item being graded")),
+        **_grade_fields(use_reasoning, choices)
+    )
+    return create_model(
+        "DynamicBatchModel",
+        results=(List[item_model], Field(description="One result per item"))
+    )
+
+
+@lru_cache(maxsize=256)
+def _grade_lookup(choices: Tuple[str, ...]) -> Dict[str, str]:
+    """Map casefolded choices to their canonical spelling."""
+    return {choice.casefold(): choice for choice in choices}
+
+
+class _InvalidGradeError(AIError):
+    """Raised when the model returns a grade that is not one of the choices."""
+    
+    def __init__(self, message: str, grade: str):
+        super().__init__(message)
+        self.grade = grade
+
+
+def _resolve_grade(raw_grade: str, choice_scores: Dict[str, float]) -> str:
+    """Map a grade returned by the model onto a key of choice_scores."""
+    if raw_grade in choice_scores:
+        return raw_grade
+    
+    # Case-insensitive match, for responses that weren't schema-constrained
+    grade = _grade_lookup(tuple(choice_scores)).get(raw_grade.strip().casefold())
+    if grade is not None:
+        return grade
+    
+    available_choices = ", ".join(choice_scores.keys())
+    raise _InvalidGradeError(f"Invalid grade '{raw_grade}' received. Expected one of: {available_choices}", raw_grade)
+
+
+def _invalid_grade_feedback(error: AIError, choice_scores: Dict[str, float]) -> Optional[List[Dict[str, str]]]:
+    """
+    Build the follow-up turns for an invalid response: the rejected response as an
+    assistant message, then a user message explaining what was wrong.
+    
+    Returns None for other failures (network, auth, ...), which are not retried here.
+    """
+    if isinstance(error, _InvalidGradeError):
+        problem = str(error)
+        rejected = json_dumps({_GRADE_KEY: error.grade})
+    elif isinstance(error.__cause__, ValidationError):
+        details = error.__cause__.errors()
+        problem = "; ".join(detail["msg"] for detail in details)
+        # The offending values, keyed by field; errors without a field (e.g. invalid JSON) carry the raw text
+        fields = {str(detail["loc"][0]): detail["input"] for detail in details if detail["loc"]}
+        try:
+            rejected = json_dumps(fields) if fields else str(details[0]["input"])
+        except TypeError:
+            rejected = str(fields)
+    else:
+        return None
+    available_choices = ", ".join(choice_scores.keys())
+    return [
+        {"role": "assistant", "content": rejected},
+        {"role": "user", "content": (
+            f"Your previous response was invalid: {problem}. "
+            f"Grade the item again. The grade must be exactly one of: {available_choices}."
+        )},
+    ]
+
+
+def _normalize_batch_item(item: Union[Tuple[str, ...], Dict[str, str]]) -> Tuple[str, str, str]:
+    """Convert a batch item (tuple or dict) into a (question, answer, expected) tuple."""
+    if isinstance(item, dict):
+        question = item.get("question", item.get("input", ""))
+        answer = item.get("answer", item.get("output", ""))
+        expected = item.get("expected", "")
     else:
-        class DynamicClassifierModel(BaseModel):
-            grade: str = Field(description=f"Final grade, must be one of: {available_choices}")
+        question, answer = item[0], item[1]
+        expected = item[2] if len(item) > 2 else ""
+    return question, answer, expected or ""
+
+
+def classify_batch(
+    items: List[Union[Tuple[str, ...], Dict[str, str]]],
+    prompt_template: str = "",
+    choice_scores: Optional[Dict[str, float]] = None,
+    system_msg: str = "",
+    use_reasoning: bool = True,
+    model: Optional[ModelType] = None,
+    provider: Optional[Union[AIProvider, str]] = None,
+    batch_size: int = 25
+) -> ClassifierBatchResult:
+    """
+    Classify many (question, answer, expected) items with fewer requests.
     
-    try:
-        # Use structured output
-        result = call_ai(
-            system_prompt=system_prompt,
-            response_format=DynamicClassifierModel,
-            model=model,
-            provider=provider,
-            user_prompt=user_prompt
+    Items are grouped into chunks of batch_size and each chunk is graded in a
+    single request, so the grading instructions are only sent once per chunk.
+    
+    Args:
+        items: List of (question, answer[, expected]) tuples, or dicts with
+            question/answer/expected (or input/output/expected) keys
+        prompt_template: Custom evaluation logic/criteria (goes into system prompt)
+        choice_scores: Mapping of choices to scores
+        system_msg: Custom system message for evaluation context
+        use_reasoning: Whether to include step-by-step reasoning
+        model: Specific model to use
+        provider: Specific provider to use
+        batch_size: Maximum number of items graded per request
+        
+    Returns:
+        ClassifierBatchResult in the same order as items (list-like, yields ClassifierResponse)
+        
+    Raises:
+        ValueError: If required parameters are missing
+        AIError: If the classification fails
+        
+    Example:
+        results = classify_batch(
+            items=[("What is 5 + 3?", "8", "8"), ("What is 7 * 6?", "43", "42")],
+            choice_scores={"CORRECT": 1.0, "INCORRECT": 0.0}
         )
         
-        # Validate grade
-        grade = result.grade.upper()
-        if grade not in choice_scores:
-            # Try case-insensitive match
-            grade_lower = result.grade.lower()
-            matched_key = None
-            for key in choice_scores.keys():
-                if key.lower() == grade_lower:
-                    matched_key = key
-                    break
+        # Dict items are also accepted
+        results = classify_batch(
+            items=[{"input": "What is 5 + 3?", "output": "8", "expected": "8"}]
+        )
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    items = [_normalize_batch_item(item) for item in items]
+    for question, answer, _ in items:
+        if not question or question.isspace():
+            raise ValueError("question cannot be empty")
+        if not answer or answer.isspace():
+            raise ValueError("answer cannot be empty")
+    
+    if choice_scores is None:
+        choice_scores = {"CORRECT": 1.0, "INCORRECT": 0.0}
+    
+    if not choice_scores:
+        raise ValueError("choice_scores cannot be empty")
+    
+    has_expected = any(expected and not expected.isspace() for _, _, expected in items)
+    system_prompt = _build_system_prompt(
+        system_msg, prompt_template, tuple(choice_scores), use_reasoning, has_expected
+    )
+    system_prompt += (
+        "\n\nYou will receive several numbered items. Grade each item independently "
+        f"and return exactly one entry per item in 'results', using the item number as '{_INDEX_KEY}'."
+    )
+    DynamicBatchModel = _get_batch_model(use_reasoning, tuple(choice_scores))
+    
+    responses = ClassifierBatchResult(metadata={
+        "model": str(model) if model else None,
+        "provider": str(provider) if provider else None,
+        "choices_available": list(choice_scores.keys()),
+        "choice_scores": choice_scores
+    })
+    for start in range(0, len(items), batch_size):
+        chunk = items[start:start + batch_size]
+        user_prompt = "\n\n".join(
+            f"=== Item {i} ===\n{_build_user_prompt(question, answer, expected)}"
+            for i, (question, answer, expected) in enumerate(chunk, 1)
+        )
+        
+        try:
+            result = call_ai(
+                system_prompt=system_prompt,
+                response_format=DynamicBatchModel,
+                model=model,
+                provider=provider,
+                user_prompt=user_prompt,
+                prompt_cache_key=_prompt_cache_key(system_prompt)
+            )
             
-            if matched_key:
-                grade = matched_key
-            else:
-                raise AIError(f"Invalid grade '{result.grade}' received. Expected one of: {available_choices}")
+            by_index = {item.index: item for item in result.results}
+            for i in range(1, len(chunk) + 1):
+                item = by_index.get(i)
+                if item is None:
+                    raise AIError(f"No grade received for item {i} of the batch")
+                grade = _resolve_grade(item.grade, choice_scores)
+                responses.append(
+                    score=choice_scores[grade],
+                    choice=grade,
+                    reasoning=getattr(item, 'reasoning', '') if use_reasoning else ''
+                )
+        except AIError:
+            raise
+        except Exception as e:
+            raise AIError(f"Batch classification failed: {str(e)}")
+    
+    return responses
+
+
+async def aclassify_text(
+    question: str,
+    answer: str,
+    expected: str = "",
+    prompt_template: str = "",
+    choice_scores: Optional[Dict[str, float]] = None,
+    system_msg: str = "",
+    use_reasoning: bool = True,
+    model: Optional[ModelType] = None,
+    provider: Optional[Union[AIProvider, str]] = None,
+    semantic_cache: Optional[SemanticClassifierCache] = None,
+    max_retries: int = 2,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> ClassifierResponse:
+    """
+    Async version of classify_text.
+    
+    Requests are awaited with acall_ai, so many classifications can run
+    concurrently with asyncio.gather without a thread each.
+    
+    Args:
+        semaphore: Optional semaphore to cap the number of in-flight requests
+        (all other arguments are the same as classify_text)
         
-        score = choice_scores[grade]
-        reasoning = getattr(result, 'reasoning', '') if use_reasoning else ''
+    Returns:
+        ClassifierResponse with score, choice, reasoning, and metadata
         
-        return ClassifierResponse(
-            score=score,
-            choice=grade,
-            reasoning=reasoning,
-            metadata={
-                "model": str(model) if model else None,
-                "provider": str(provider) if provider else None,
-                "choices_available": list(choice_scores.keys()),
-                "choice_scores": choice_scores
-            }
-        )
+    Example:
+        results = await asyncio.gather(*[
+            aclassify_text(question=q, answer=a, expected=e)
+            for q, a, e in items
+        ])
+    """
+    prepared = _prepare_classification(
+        question, answer, expected, prompt_template, choice_scores, system_msg, use_reasoning, model, provider
+    )
+    if semaphore is None:
+        return await _aclassify(prepared, use_reasoning, model, provider, semantic_cache, max_retries)
+    async with semaphore:
+        return await _aclassify(prepared, use_reasoning, model, provider, semantic_cache, max_retries)
+
+
+async def _aclassify(
+    prepared: _PreparedClassification,
+    use_reasoning: bool,
+    model: Optional[ModelType],
+    provider: Optional[Union[AIProvider, str]],
+    semantic_cache: Optional[SemanticClassifierCache],
+    max_retries: int
+) -> ClassifierResponse:
+    # Embedding for the semantic cache is blocking work, so it runs in a worker thread
+    if semantic_cache is not None:
+        cached = await asyncio.to_thread(semantic_cache.lookup, prepared.cache_text, prepared.cache_namespace)
+        if cached is not None:
+            return cached
+    
+    try:
+        messages = [{"role": "user", "content": prepared.user_prompt}]
+        for attempt in range(max_retries + 1):
+            try:
+                result = await acall_ai(messages=messages, **prepared.call_kwargs)
+                grade = _resolve_grade(result.grade, prepared.choice_scores)
+                break
+            except AIError as e:
+                feedback = _invalid_grade_feedback(e, prepared.choice_scores)
+                if feedback is None or attempt == max_retries:
+                    raise
+                # Ask again for the same item, showing the model its answer and what was wrong
+                messages = messages + feedback
+        
+        response = _classifier_response(prepared, result, grade, use_reasoning, model, provider)
+        if semantic_cache is not None:
+            await asyncio.to_thread(semantic_cache.add, prepared.cache_text, prepared.cache_namespace, response)
+        return response
         
     except AIError:
         raise
@@ -184,13 +756,69 @@ Your grade must be exactly one of the specified options."""
         raise AIError(f"Classification failed: {str(e)}")
 
 
+async def aclassify_many(
+    items: List[Union[Tuple[str, ...], Dict[str, str]]],
+    max_concurrency: int = 10,
+    **kwargs
+) -> List[ClassifierResponse]:
+    """
+    Async version of classify_many.
+    
+    Args:
+        items: List of (question, answer[, expected]) tuples or dicts, as for classify_batch
+        max_concurrency: Maximum number of classification requests in flight at once
+        **kwargs: Settings passed to aclassify_text (prompt_template, choice_scores, model, ...)
+        
+    Returns:
+        List of ClassifierResponse in the same order as items
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*[
+        aclassify_text(question=question, answer=answer, expected=expected, semaphore=semaphore, **kwargs)
+        for question, answer, expected in map(_normalize_batch_item, items)
+    ])
+
+
+def classify_many(
+    items: List[Union[Tuple[str, ...], Dict[str, str]]],
+    max_concurrency: int = 10,
+    **kwargs
+) -> List[ClassifierResponse]:
+    """
+    Classify many items concurrently, one request per item.
+    
+    Unlike classify_batch, every item is graded in its own request, so results
+    match classify_text exactly while requests run in parallel.
+    
+    Args:
+        items: List of (question, answer[, expected]) tuples or dicts, as for classify_batch
+        max_concurrency: Maximum number of classification requests in flight at once
+        **kwargs: Settings passed to classify_text (prompt_template, choice_scores, model, ...)
+        
+    Returns:
+        List of ClassifierResponse in the same order as items
+        
+    Example:
+        results = classify_many(
+            [("What is 5 + 3?", "8", "8"), ("What is 7 * 6?", "43", "42")],
+            choice_scores={"CORRECT": 1.0, "INCORRECT": 0.0},
+            max_concurrency=5
+        )
+    """
+    return _run_async(aclassify_many(items, max_concurrency=max_concurrency, **kwargs))
+
+
 def create_classifier(
     prompt_template: str,
     choice_scores: Dict[str, float],
     system_msg: str = "",
     use_reasoning: bool = True,
     model: Optional[ModelType] = None,
-    provider: Optional[Union[AIProvider, str]] = None
+    provider: Optional[Union[AIProvider, str]] = None,
+    semantic_cache: Optional[SemanticClassifierCache] = None
 ) -> callable:
     """
     Create a reusable classifier function with predefined settings.
@@ -205,6 +833,7 @@ def create_classifier(
         use_reasoning: Whether to include reasoning
         model: Default model to use
         provider: Default provider to use
+        semantic_cache: Optional SemanticClassifierCache shared by all calls
         
     Returns:
         A callable classifier function
@@ -220,7 +849,23 @@ def create_classifier(
         # Use it multiple times with clear keyword arguments
         result1 = grader(question="2+2", answer="4", expected="4")
         result2 = grader(question="3+3", answer="6", expected="6")
+        
+        # Or concurrently from async code
+        result3 = await grader.acall(question="4+4", answer="8", expected="8")
+        
+        # Or several items in a single request
+        results = grader.batch([("2+2", "4", "4"), ("3+3", "7", "6")])
     """
+    # Settings are fixed from here on, so build the prompts and response
+    # model up front rather than on the first graded item
+    if choice_scores:
+        choices = tuple(choice_scores)
+        for has_expected in (True, False):
+            _prompt_cache_key(_build_system_prompt(
+                system_msg, prompt_template, choices, use_reasoning, has_expected
+            ))
+        _get_classifier_model(use_reasoning, choices)
+    
     def classifier(
         question: str,
         answer: str,
@@ -244,9 +889,51 @@ def create_classifier(
             system_msg=system_msg,
             use_reasoning=use_reasoning,
             model=kwargs.get('model', model),
-            provider=kwargs.get('provider', provider)
+            provider=kwargs.get('provider', provider),
+            semantic_cache=kwargs.get('semantic_cache', semantic_cache),
+            max_retries=kwargs.get('max_retries', 2)
+        )
+    
+    async def acall(
+        question: str,
+        answer: str,
+        expected: str = "",
+        **kwargs
+    ) -> ClassifierResponse:
+        """Async version of the classifier, see aclassify_text."""
+        return await aclassify_text(
+            question=question,
+            answer=answer,
+            expected=expected,
+            prompt_template=prompt_template,
+            choice_scores=choice_scores,
+            system_msg=system_msg,
+            use_reasoning=use_reasoning,
+            model=kwargs.get('model', model),
+            provider=kwargs.get('provider', provider),
+            semantic_cache=kwargs.get('semantic_cache', semantic_cache),
+            max_retries=kwargs.get('max_retries', 2),
+            semaphore=kwargs.get('semaphore')
+        )
+    
+    def batch(
+        items: List[Union[Tuple[str, ...], Dict[str, str]]],
+        **kwargs
+    ) -> ClassifierBatchResult:
+        """Classify many (question, answer, expected) items, see classify_batch."""
+        return classify_batch(
+            items=items,
+            prompt_template=prompt_template,
+            choice_scores=choice_scores,
+            system_msg=system_msg,
+            use_reasoning=use_reasoning,
+            model=kwargs.get('model', model),
+            provider=kwargs.get('provider', provider),
+            batch_size=kwargs.get('batch_size', 25)
         )
     
+    classifier.acall = acall
+    classifier.batch = batch
     return classifier
 
 
@@ -11,6 +11,7 @@ from .models import AIError
 from .setup import setup_user_preferences, show_current_config
 from .helper import find_chrome_binary, get_chrome_version, generate_random_number, generate_uuid
 from .classifier import classify_text
+from .utils.json_utils import json_dumps, json_loads
 
 
 
@@ -166,17 +167,17 @@ def main():
             
         elif args.command == 'classify':
             try:
-                choices = json.loads(args.choices) if args.choices else None
+                choices = json_loads(args.choices) if args.choices else None
                 result = classify_text(
                     question=args.question,
                     answer=args.answer,
-                    expected_response=args.expected,
-                    choices=choices,
-                    custom_prompt=args.prompt,
-                    no_reasoning=args.no_reasoning,
+                    expected=args.expected,
+                    choice_scores=choices,
+                    prompt_template=args.prompt or "",
+                    use_reasoning=not args.no_reasoning,
                     model=args.model
                 )
-                print(json.dumps(result, indent=2))
+                print(json_dumps(result.model_dump(), indent=True))
             except json.JSONDecodeError:
                 print("Error: Invalid JSON format for choices", file=sys.stderr)
                 sys.exit(1)
@@ -198,12 +199,12 @@ def main():
                 # Format output
                 if isinstance(result, dict) or args.json:
                     if isinstance(result, dict):
-                        print(json.dumps(result, indent=2))
+                        print(json_dumps(result, indent=True))
                     else:
                         # Try to parse as JSON for pretty printing
                         try:
-                            parsed = json.loads(result)
-                            print(json.dumps(parsed, indent=2))
+                            parsed = json_loads(result)
+                            print(json_dumps(parsed, indent=True))
                         except json.JSONDecodeError:
                             print(result)
                 else:
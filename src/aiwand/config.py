@@ -6,14 +6,20 @@ and provider resolution utilities.
 """
 
 import os
-import json
+import ssl
+import time
+import atexit
+import asyncio
+import weakref
+import hashlib
+import threading
+import itertools
+import importlib.util
 from pathlib import Path  
-from typing import Dict, Any, Optional, Tuple, List, Union
+from typing import TYPE_CHECKING, Awaitable, Dict, Any, NamedTuple, Optional, Tuple, List, TypeVar, Union, Callable, Iterator
+from functools import lru_cache, partial
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from google.genai import (
-    Client as GeminiClient
-)
-from openai import OpenAI
+from pydantic import ValidationError
 
 from .prompts import DEFAULT_SYSTEM_PROMPT, OCR_SYSTEM_PROMPT
 from .models import (
@@ -26,54 +32,302 @@ from .models import (
     AiSearchResult,
     FullAiResponse
 )
-from .preferences import get_preferred_provider_and_model
+from .preferences import get_preferred_provider_and_model, get_config_dir, get_config_file
+from .cache import (
+    is_cache_enabled,
+    make_cache_key,
+    get_response_cache,
+    dump_response,
+    load_response
+)
 from .utils import (
     image_to_data_url,
     document_to_data_url,
     get_gemini_response,
+    aget_gemini_response,
+    get_gemini_stream,
     remove_empty_values,
     print_debug_messages,
     get_openai_response,
+    aget_openai_response,
+    get_openai_stream,
     sleep_with_backoff,
-    chatcompletion_usage_details
+    backoff_delay,
+    chatcompletion_usage_details,
+    json_dumps,
+    json_loads
 )
 
-# Client cache to avoid recreating clients
-_client_cache: Dict[AIProvider, Union[OpenAI, GeminiClient]] = {}
+if TYPE_CHECKING:
+    # httpx, openai and google.genai are imported lazily, when the first client is created
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+    from google.genai import Client as GeminiClient
 
+T = TypeVar("T")
 
+# Client cache to avoid recreating clients, as (api_key fingerprint, client) per provider
+_client_cache: Dict[AIProvider, Tuple[bytes, Union["OpenAI", "GeminiClient"]]] = {}
+_client_lock = threading.Lock()
 
-def _get_cached_client(provider: AIProvider) -> Union[OpenAI, GeminiClient]:
-    """Get or create a cached client for the provider."""
-    if provider not in _client_cache:
-        # Get provider configuration from registry
-        env_var = ProviderRegistry.get_env_var(provider)
-        base_url = ProviderRegistry.get_base_url(provider)
+# Shared connection pool for OpenAI-compatible clients
+_http_client: Optional["httpx.Client"] = None
+
+# Async clients per event loop, as (api_key fingerprint, client) per provider
+_async_client_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[AIProvider, Tuple[bytes, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# TLS context shared by every provider client, so CA certificates are loaded once
+_ssl_context: Optional[ssl.SSLContext] = None
+
+# Set to 1 to open a connection in the background when a client is created
+WARMUP_ENV_VAR = "AIWAND_WARMUP"
+
+# Model catalogue cache as (fetched at, models), keyed by provider + API key hash
+_models_cache: Dict[str, Tuple[float, List[Any]]] = {}
+MODELS_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the SSL context shared by all provider clients.
+    Honours SSL_CERT_FILE / SSL_CERT_DIR like the Gemini SDK does.
+    Must be called with _client_lock held.
+    """
+    global _ssl_context
+    if _ssl_context is None:
+        import certifi
+        _ssl_context = ssl.create_default_context(
+            cafile=os.environ.get("SSL_CERT_FILE", certifi.where()),
+            capath=os.environ.get("SSL_CERT_DIR"),
+        )
+    return _ssl_context
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """
+    Connection settings shared by the sync and async httpx clients.
+    Must be called with _client_lock held.
+    """
+    import httpx
+    return {
+        "http2": importlib.util.find_spec("h2") is not None,
+        "verify": _get_ssl_context(),
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        "timeout": httpx.Timeout(600.0, connect=5.0),
+        "follow_redirects": True,
+    }
+
+
+def _get_http_client() -> "httpx.Client":
+    """
+    Get the shared httpx client used by all OpenAI-compatible clients.
+    Keeps connections alive across calls; HTTP/2 is used when `h2` is installed.
+    Must be called with _client_lock held.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.Client(**_http_client_options())
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+def _get_api_key(provider: AIProvider) -> Tuple[str, bytes]:
+    """Return the provider's API key from the environment and a fingerprint of it."""
+    # Get provider configuration from registry
+    env_var = ProviderRegistry.get_env_var(provider)
+    if not env_var:
+        raise AIError(f"Unsupported provider: {provider}")
+    
+    api_key = os.getenv(env_var)
+    if not api_key:
+        raise AIError(f"{provider.value.title()} API key not found. Please set {env_var} environment variable.")
+    
+    return api_key, hashlib.blake2b(api_key.encode("utf-8"), digest_size=8).digest()
+
+
+def _new_gemini_client(api_key: str) -> "GeminiClient":
+    """Must be called with _client_lock held."""
+    from google.genai import Client as GeminiClient, types as gemini_types
+    return GeminiClient(
+        api_key=api_key,
+        http_options=gemini_types.HttpOptions(client_args={"verify": _get_ssl_context()}),
+    )
+
+
+def _get_cached_client(provider: AIProvider) -> Union["OpenAI", "GeminiClient"]:
+    """
+    Get or create a cached client for the provider.
+    
+    Clients are cached together with a fingerprint of the API key they were
+    created with, so a rotated key in the environment gets a fresh client.
+    """
+    api_key, fingerprint = _get_api_key(provider)
+    cached = _client_cache.get(provider)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    with _client_lock:
+        cached = _client_cache.get(provider)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
         
-        if not env_var:
-            raise AIError(f"Unsupported provider: {provider}")
+        base_url = ProviderRegistry.get_base_url(provider)
+        if provider == AIProvider.GEMINI:
+            client = _new_gemini_client(api_key)
+        else:
+            from openai import OpenAI
+            if base_url:
+                client = OpenAI(api_key=api_key, base_url=base_url, http_client=_get_http_client())
+            else:
+                client = OpenAI(api_key=api_key, http_client=_get_http_client())
         
-        api_key = os.getenv(env_var)
-        if not api_key:
-            raise AIError(f"{provider.value.title()} API key not found. Please set {env_var} environment variable.")
+        _client_cache[provider] = (fingerprint, client)
+    
+    if _is_warmup_enabled():
+        threading.Thread(target=_warm_connection, args=(provider, client), daemon=True).start()
+    return client
+
+
+def _is_warmup_enabled() -> bool:
+    """
+    Connection warm-up is opt-in, since it sends an extra models.list request:
+    on only when the AIWAND_WARMUP env var is set to 1/true/yes/on.
+    """
+    return os.getenv(WARMUP_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _warm_connection(provider: AIProvider, client: Union["OpenAI", "GeminiClient"]) -> None:
+    """
+    Open a connection to the provider ahead of the first request, so the TCP and
+    TLS handshakes are already done when it is sent. Errors are ignored; the
+    real request will report them.
+    """
+    try:
+        if provider == AIProvider.GEMINI:
+            client.models.list(config={"page_size": 1})
+        else:
+            client.with_options(timeout=10.0, max_retries=0).models.list()
+    except Exception:
+        pass
+
 
+def _get_cached_async_client(provider: AIProvider) -> Union["AsyncOpenAI", "GeminiClient"]:
+    """
+    Get or create a cached async client for the provider.
+    
+    Async connection pools belong to the event loop they were opened on, so
+    clients are cached per running loop (and per API key fingerprint, like
+    _get_cached_client). Gemini clients are returned whole; use client.aio.
+    """
+    loop = asyncio.get_running_loop()
+    api_key, fingerprint = _get_api_key(provider)
+    with _client_lock:
+        loop_clients = _async_client_cache.setdefault(loop, {})
+        cached = loop_clients.get(provider)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        base_url = ProviderRegistry.get_base_url(provider)
         if provider == AIProvider.GEMINI:
-            _client_cache[provider] = GeminiClient(api_key=api_key)
-        elif base_url:
-            _client_cache[provider] = OpenAI(api_key=api_key, base_url=base_url)
+            client = _new_gemini_client(api_key)
+        else:
+            import httpx
+            from openai import AsyncOpenAI
+            http_client = httpx.AsyncClient(**_http_client_options())
+            if base_url:
+                client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+            else:
+                client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        
+        loop_clients[provider] = (fingerprint, client)
+        return client
+
+
+async def _close_async_clients() -> None:
+    """Close the async clients cached for the running event loop and forget them."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        loop_clients = _async_client_cache.pop(loop, {})
+    for provider, (_, client) in loop_clients.items():
+        try:
+            if provider == AIProvider.GEMINI:
+                # Older google-genai versions have no async close
+                aclose = getattr(client.aio, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            else:
+                await client.close()
+        except Exception:
+            pass
+
+
+def _run_async(coro: Awaitable[T]) -> T:
+    """
+    Run coro on a new event loop, like asyncio.run, closing the async provider
+    clients opened on that loop before it ends so their connections aren't leaked.
+    Used by the sync batch helpers.
+    """
+    async def run_and_close() -> T:
+        try:
+            return await coro
+        finally:
+            await _close_async_clients()
+    return asyncio.run(run_and_close())
+
+
+@lru_cache(maxsize=64)
+def _resolve_explicit_provider_model(
+    model: Optional[ModelType],
+    provider: Optional[Union[AIProvider, str]]
+) -> Optional[Tuple[AIProvider, str]]:
+    """
+    Resolve (provider, model_name) when the arguments alone determine them.
+    
+    Returns None when the answer depends on user preferences. Only depends on
+    the static registry, so results are memoized.
+    """
+    # Normalize once; str() of a model enum is its value
+    model_name = str(model) if model is not None else None
+    
+    # Handle explicit provider specification
+    if provider is not None:
+        # Convert string to AIProvider enum if needed
+        if isinstance(provider, str):
+            provider_enum = ProviderRegistry.get_provider_enum(provider.lower())
+            if provider_enum is None:
+                raise AIError(f"Unknown provider: {provider}. Supported providers: {[p.value for p in AIProvider]}")
         else:
-            _client_cache[provider] = OpenAI(api_key=api_key)
+            provider_enum = provider
+        
+        # Use explicit provider with provided model or get default model for provider
+        if model_name is not None:
+            return provider_enum, model_name
+        default_model = ProviderRegistry.get_default_model(provider_enum)
+        if not default_model:
+            raise AIError(f"No default model available for provider: {provider_enum}")
+        return provider_enum, str(default_model)
     
-    return _client_cache[provider]
+    # No explicit provider, try to infer from model (includes pattern matching)
+    if model_name is not None:
+        inferred_provider = ProviderRegistry.infer_provider_from_model(model_name)
+        if inferred_provider is not None:
+            return inferred_provider, model_name
+    return None
 
 
 def _resolve_provider_model_client(
     model: Optional[ModelType] = None, 
     provider: Optional[Union[AIProvider, str]] = None
-) -> Tuple[AIProvider, str, OpenAI]:
+) -> Tuple[AIProvider, str, "OpenAI"]:
     """
     Resolve provider, model name, and client based on input model, provider, or preferences.
     
+    The client is always looked up through _get_cached_client, so rotated API
+    keys and changed preferences still take effect.
+    
     Args:
         model: Optional model to use for inference
         provider: Optional provider to use explicitly (AIProvider enum or string)
@@ -84,44 +338,31 @@ def _resolve_provider_model_client(
     Raises:
         AIError: When no provider is available
     """
-    # Handle explicit provider specification
-    if provider is not None:
-        # Convert string to AIProvider enum if needed
-        if isinstance(provider, str):
-            try:
-                provider_enum = AIProvider(provider.lower())
-            except ValueError:
-                raise AIError(f"Unknown provider: {provider}. Supported providers: {[p.value for p in AIProvider]}")
-        else:
-            provider_enum = provider
-        
-        # Use explicit provider with provided model or get default model for provider
-        if model is not None:
-            return provider_enum, str(model), _get_cached_client(provider_enum)
-        else:
-            default_model = ProviderRegistry.get_default_model(provider_enum)
-            if not default_model:
-                raise AIError(f"No default model available for provider: {provider_enum}")
-            return provider_enum, str(default_model), _get_cached_client(provider_enum)
+    provider_enum, model_name = _resolve_provider_model(model, provider)
+    return provider_enum, model_name, _get_cached_client(provider_enum)
+
+
+def _resolve_provider_model(
+    model: Optional[ModelType] = None, 
+    provider: Optional[Union[AIProvider, str]] = None
+) -> Tuple[AIProvider, str]:
+    """Resolve provider and model name like _resolve_provider_model_client, without a client."""
+    explicit = _resolve_explicit_provider_model(model, provider)
+    if explicit is not None:
+        return explicit
     
-    # No explicit provider, try to infer from model
     if model is not None:
-        # Try to infer provider from model (now includes pattern matching)
-        inferred_provider = ProviderRegistry.infer_provider_from_model(model)
-        if inferred_provider is not None:
-            return inferred_provider, str(model), _get_cached_client(inferred_provider)
-        else:
-            # Model provided but can't infer provider, use preferences with provided model
-            fallback_provider, _ = get_preferred_provider_and_model()
-            if not fallback_provider:
-                raise AIError("No AI provider available. Please set up your API keys.")
-            return fallback_provider, str(model), _get_cached_client(fallback_provider)
-    else:
-        # No model or provider provided, use current preferences
-        pref_provider, preferred_model = get_preferred_provider_and_model()
-        if not pref_provider or not preferred_model:
-            raise AIError("No AI provider available. Please set up your API keys and run 'aiwand setup'.")
-        return pref_provider, str(preferred_model), _get_cached_client(pref_provider)
+        # Model provided but can't infer provider, use preferences with provided model
+        fallback_provider, _ = get_preferred_provider_and_model()
+        if not fallback_provider:
+            raise AIError("No AI provider available. Please set up your API keys.")
+        return fallback_provider, str(model)
+    
+    # No model or provider provided, use current preferences
+    pref_provider, preferred_model = get_preferred_provider_and_model()
+    if not pref_provider or not preferred_model:
+        raise AIError("No AI provider available. Please set up your API keys and run 'aiwand setup'.")
+    return pref_provider, str(preferred_model)
 
 
 def process_single_ocr(
@@ -229,43 +470,29 @@ def ocr(
         # Limit to 10 workers max to avoid overwhelming the API, but use fewer for small batches
         max_workers = min(10, max(1, total_items))
     
-    all_results = []
+    # Submit images and documents to a single pool so all items run concurrently
+    tasks = [
+        (image, OCRContentType.IMAGE, i, len(images))
+        for i, image in enumerate(images or [])
+    ] + [
+        (doc_link, OCRContentType.DOCUMENT, i, len(document_links))
+        for i, doc_link in enumerate(document_links or [])
+    ]
     
-    # Process images in parallel if provided
-    if images:
-        if debug:
-            print(f"Processing {len(images)} images in parallel...")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all image processing tasks
-            future_to_index_images = {
-                executor.submit(process_single_ocr, image, OCRContentType.IMAGE, i, len(images), ocr_system_prompt, additional_system_instructions, model, debug): i
-                for i, image in enumerate(images)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_index_images):
-                result = future.result()
-                if result is not None:
-                    all_results.append(result)
-    
-    # Process documents in parallel if provided
-    if document_links:
-        if debug:
-            print(f"Processing {len(document_links)} documents in parallel...")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all document processing tasks
-            future_to_index_documents = {
-                executor.submit(process_single_ocr, doc_link, OCRContentType.DOCUMENT, i, len(document_links), ocr_system_prompt, additional_system_instructions, model, debug): i
-                for i, doc_link in enumerate(document_links)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_index_documents):
-                result = future.result()
-                if result is not None:
-                    all_results.append(result)
+    all_results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_position = {
+            executor.submit(process_single_ocr, content, content_type, i, count, ocr_system_prompt, additional_system_instructions, model, debug): position
+            for position, (content, content_type, i, count) in enumerate(tasks)
+        }
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_position):
+            result = future.result()
+            if result is not None:
+                all_results.append((future_to_position[future], result[1]))
     
-    # Sort results by original index to maintain order
+    # Sort results by original position to maintain order (images, then documents)
     all_results.sort(key=lambda x: x[0])
     
     # Extract just the text content
@@ -300,8 +527,13 @@ def call_ai(
     use_vision: Optional[bool] = True,
     max_workers: Optional[int] = None,
     retries: Optional[int] = 2,
-    raw_response: Optional[bool] = False
-) -> Union[str, AiSearchResult, FullAiResponse]:
+    raw_response: Optional[bool] = False,
+    bypass_cache: Optional[bool] = False,
+    stream: Optional[bool] = False,
+    on_token: Optional[Callable[[str], None]] = None,
+    prompt_cache_key: Optional[str] = None,
+    retry_invalid_responses: Optional[bool] = True
+) -> Union[str, AiSearchResult, FullAiResponse, Iterator[str]]:
     """
     Unified wrapper for AI API calls that handles provider differences.
     
@@ -344,11 +576,254 @@ def call_ai(
                  Default: 2.
         raw_response: Optional boolean to return the raw response and usage_metadata from the API.
                           Default: False. Returns FullAiResponse if True.
+        bypass_cache: Optional boolean to skip the response cache for this call.
+                      The cache is only used when the AIWAND_CACHE environment variable is set.
+        stream: Optional boolean to stream the response. Returns an iterator of text chunks
+                instead of the full text. Not supported with response_format, raw_response
+                or use_google_search.
+        on_token: Optional callback invoked with each text chunk as it arrives.
+                  Without stream=True the full text is still returned at the end.
+        prompt_cache_key: Optional key grouping requests that share a long prompt prefix
+                          (e.g. the same system prompt), so OpenAI routes them to the same
+                          prompt cache. Gemini caches shared prefixes implicitly.
+        retry_invalid_responses: Optional boolean to retry (and fall back to other models) when a
+                                 response fails validation against response_format. Set to False
+                                 to get the validation error right away, e.g. to re-ask the model
+                                 with feedback yourself; network and rate limit errors are still retried.
     Returns:
         Union[str, AiSearchResult]: The AI response content or AiSearchResult if use_google_search is True.
+                                    Iterator[str] of text chunks if stream is True.
+        
+    Raises:
+        ValueError: When stream/on_token is combined with an unsupported option
+        AIError: When the API call fails
+    """
+    streaming = bool(stream) or on_token is not None
+    if streaming and (response_format or raw_response or use_google_search):
+        raise ValueError("stream/on_token cannot be used with response_format, raw_response or use_google_search")
+
+    prepared = _prepare_call(
+        messages=messages,
+        max_output_tokens=max_output_tokens,
+        temperature=temperature,
+        top_p=top_p,
+        model=model,
+        fallback_models=fallback_models,
+        provider=provider,
+        response_format=response_format,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        additional_system_instructions=additional_system_instructions,
+        images=images,
+        document_links=document_links,
+        tool_choice=tool_choice,
+        tools=tools,
+        debug=debug,
+        use_google_search=use_google_search,
+        use_ocr=use_ocr,
+        use_vision=use_vision,
+        max_workers=max_workers,
+        retries=retries,
+        raw_response=raw_response,
+        bypass_cache=bypass_cache,
+        prompt_cache_key=prompt_cache_key,
+        streaming=streaming
+    )
+    if prepared.cached_response is not None:
+        if debug:
+            print("Returning cached AI response")
+        return load_response(prepared.cached_response, response_format)
+
+    failure_count = 0
+    # Provider/model/client resolution per model, reused across retry attempts
+    resolved: Dict[Any, Tuple[str, Any, Callable[..., Any]]] = {}
+    for current_model, attempt_idx in prepared.plan:
+        try:
+            if current_model not in resolved:
+                current_provider, model_name, client = _resolve_provider_model_client(current_model, provider)
+                request_fns = _STREAM_FNS if streaming else _RESPONSE_FNS
+                resolved[current_model] = (
+                    model_name, client, request_fns.get(current_provider, request_fns[None])
+                )
+            model_name, client, request_fn = resolved[current_model]
+            
+            params = {"model": model_name, "messages": prepared.messages, **prepared.request_options}
+
+            if streaming:
+                chunks = _prime_stream(request_fn(client, params, debug), on_token)
+                if stream:
+                    return chunks
+                return "".join(chunks)
+
+            content = request_fn(client, params, debug, raw_response)
+            if prepared.cache_key is not None:
+                _store_response(prepared.cache_key, content)
+            return content
+        except _PROGRAMMING_ERRORS:
+            raise
+        except Exception as e:
+            _raise_if_last_attempt(
+                e, current_model, attempt_idx, prepared.plan, debug,
+                last=not retry_invalid_responses and isinstance(e, ValidationError)
+            )
+            failure_count += 1
+            sleep_with_backoff(failure_count)
+
+
+async def acall_ai(
+    messages: Optional[List[Dict[str, str]]] = None,
+    max_output_tokens: Optional[int] = None,
+    temperature: float = 0.7,
+    top_p: float = 1.0,
+    model: Optional[ModelType] = GeminiModel.GEMINI_2_5_FLASH_LITE,
+    fallback_models: Optional[List[ModelType]] = [GeminiModel.GEMINI_2_0_FLASH_LITE],
+    provider: Optional[Union[AIProvider, str]] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    system_prompt: Optional[str] = None,
+    user_prompt: Optional[str] = None,
+    additional_system_instructions: Optional[str] = None,
+    images: Optional[List[Union[str, Path, bytes]]] = None,
+    document_links: Optional[List[str]] = None,
+    reasoning_effort: Optional[str] = None,
+    tool_choice: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    debug: Optional[bool] = False,
+    use_google_search: Optional[bool] = False,
+    use_ocr: Optional[bool] = False,
+    use_vision: Optional[bool] = True,
+    max_workers: Optional[int] = None,
+    retries: Optional[int] = 2,
+    raw_response: Optional[bool] = False,
+    bypass_cache: Optional[bool] = False,
+    prompt_cache_key: Optional[str] = None,
+    retry_invalid_responses: Optional[bool] = True
+) -> Union[str, AiSearchResult, FullAiResponse]:
+    """
+    Async version of call_ai.
+    
+    Requests are awaited on async provider clients, which are cached per event
+    loop, so many calls can run concurrently with asyncio.gather without a
+    thread each. Image/document preprocessing and response cache access,
+    which block, run in a worker thread. Streaming is not supported.
+    
+    Args:
+        Same as call_ai, except stream and on_token
+        
+    Returns:
+        Union[str, AiSearchResult, FullAiResponse]: Same as call_ai
         
     Raises:
         AIError: When the API call fails
+        
+    Example:
+        answers = await asyncio.gather(*[
+            acall_ai(user_prompt=prompt) for prompt in prompts
+        ])
+    """
+    use_cache = not bypass_cache and is_cache_enabled()
+    prepare = partial(
+        _prepare_call,
+        messages=messages,
+        max_output_tokens=max_output_tokens,
+        temperature=temperature,
+        top_p=top_p,
+        model=model,
+        fallback_models=fallback_models,
+        provider=provider,
+        response_format=response_format,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        additional_system_instructions=additional_system_instructions,
+        images=images,
+        document_links=document_links,
+        tool_choice=tool_choice,
+        tools=tools,
+        debug=debug,
+        use_google_search=use_google_search,
+        use_ocr=use_ocr,
+        use_vision=use_vision,
+        max_workers=max_workers,
+        retries=retries,
+        raw_response=raw_response,
+        bypass_cache=bypass_cache,
+        prompt_cache_key=prompt_cache_key,
+        streaming=False
+    )
+    if images or document_links or use_cache:
+        prepared = await asyncio.to_thread(prepare)
+    else:
+        prepared = prepare()
+    if prepared.cached_response is not None:
+        if debug:
+            print("Returning cached AI response")
+        return load_response(prepared.cached_response, response_format)
+
+    failure_count = 0
+    # Provider/model resolution per model, reused across retry attempts
+    resolved: Dict[Any, Tuple[AIProvider, str]] = {}
+    for current_model, attempt_idx in prepared.plan:
+        try:
+            if current_model not in resolved:
+                resolved[current_model] = _resolve_provider_model(current_model, provider)
+            current_provider, model_name = resolved[current_model]
+            client = _get_cached_async_client(current_provider)
+            request_fn = _ARESPONSE_FNS.get(current_provider, _ARESPONSE_FNS[None])
+            
+            params = {"model": model_name, "messages": prepared.messages, **prepared.request_options}
+            content = await request_fn(client, params, debug, raw_response)
+            if prepared.cache_key is not None:
+                await asyncio.to_thread(_store_response, prepared.cache_key, content)
+            return content
+        except _PROGRAMMING_ERRORS:
+            raise
+        except Exception as e:
+            _raise_if_last_attempt(
+                e, current_model, attempt_idx, prepared.plan, debug,
+                last=not retry_invalid_responses and isinstance(e, ValidationError)
+            )
+            failure_count += 1
+            await asyncio.sleep(backoff_delay(failure_count))
+
+
+class _PreparedCall(NamedTuple):
+    """What call_ai/acall_ai work out once, before trying models in turn."""
+    plan: List[Tuple[Any, int]]
+    cache_key: Optional[str]
+    cached_response: Optional[str]
+    messages: List[Dict[str, Any]]
+    request_options: Dict[str, Any]
+
+
+def _prepare_call(
+    messages: Optional[List[Dict[str, str]]],
+    max_output_tokens: Optional[int],
+    temperature: float,
+    top_p: float,
+    model: Optional[ModelType],
+    fallback_models: Optional[List[ModelType]],
+    provider: Optional[Union[AIProvider, str]],
+    response_format: Optional[Any],
+    system_prompt: Optional[str],
+    user_prompt: Optional[str],
+    additional_system_instructions: Optional[str],
+    images: Optional[List[Union[str, Path, bytes]]],
+    document_links: Optional[List[str]],
+    tool_choice: Optional[str],
+    tools: Optional[List[Dict[str, Any]]],
+    debug: Optional[bool],
+    use_google_search: Optional[bool],
+    use_ocr: Optional[bool],
+    use_vision: Optional[bool],
+    max_workers: Optional[int],
+    retries: Optional[int],
+    raw_response: Optional[bool],
+    bypass_cache: Optional[bool],
+    prompt_cache_key: Optional[str],
+    streaming: bool
+) -> _PreparedCall:
+    """
+    Build the (model, attempt) plan, check the response cache and assemble the
+    request. On a cache hit, cached_response is set and nothing else is computed.
     """
     ordered = list(dict.fromkeys([model, *(fallback_models or [])]))
     attempts_per_model = max(0, int(retries)) + 1
@@ -356,90 +831,188 @@ def call_ai(
     if not plan:
         raise AIError("No model provided and no fallbacks available.")    
 
+    cache_key = None
+    if not bypass_cache and not raw_response and not use_google_search and not streaming and is_cache_enabled():
+        cache_key = make_cache_key({
+            "models": ordered,
+            "provider": provider,
+            "messages": messages,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "additional_system_instructions": additional_system_instructions,
+            "images": _media_cache_key(images),
+            "document_links": _media_cache_key(document_links),
+            "use_ocr": use_ocr,
+            "use_vision": use_vision,
+            "temperature": temperature,
+            "top_p": top_p,
+            "max_output_tokens": max_output_tokens,
+            "response_format": response_format,
+            "tool_choice": tool_choice,
+            "tools": tools,
+        })
+        cached = get_response_cache().get(cache_key)
+        if cached is not None:
+            return _PreparedCall(plan, cache_key, cached, [], {})
+
     ocr_context, image_urls, document_parts = _precompute_context(
         images, document_links, use_ocr, use_vision, max_workers,
         additional_system_instructions, debug, primary_model=model
     )
 
-    failure_count = 0
-    for current_model, attempt_idx in plan:
+    # Optional request parameters are the same for every attempt, so drop unset ones once
+    request_options = remove_empty_values({
+        "temperature": temperature,
+        "top_p": top_p,
+        "tool_choice": tool_choice,
+        "tools": tools,
+        "max_completion_tokens": max_output_tokens,
+        # "reasoning_effort": reasoning_effort,
+        "response_format": response_format,
+        "prompt_cache_key": prompt_cache_key,
+        # Only read by the Gemini request path
+        "use_google_search": use_google_search or None,
+    })
+
+    # The message list doesn't depend on the model, so it is built once for all attempts
+    final_messages = _build_messages(
+        messages, system_prompt, additional_system_instructions, user_prompt,
+        ocr_context, image_urls, document_parts
+    )
+
+    return _PreparedCall(plan, cache_key, None, final_messages, request_options)
+
+
+def _media_cache_key(sources: Optional[List[Union[str, Path, bytes]]]) -> Optional[List[Any]]:
+    """
+    Cache key form of images/document_links. Local files are keyed on path,
+    modification time and size, so editing a file invalidates cached responses.
+    Bytes are hashed by make_cache_key; URLs and data URLs are used as-is.
+    """
+    if not sources:
+        return sources
+    keyed = []
+    for src in sources:
+        if isinstance(src, bytes) or (isinstance(src, str) and src.startswith(("data:", "http"))):
+            keyed.append(src)
+            continue
         try:
-            current_provider, model_name, client = _resolve_provider_model_client(
-                current_model, provider
-            )
-            
-            if messages is None:
-                messages = []
-            final_messages = messages.copy()            
-            has_system_message = any(msg.get("role") == "system" for msg in final_messages)
-            if not has_system_message:
-                final_messages.insert(0, {"role": "system", "content": system_prompt or DEFAULT_SYSTEM_PROMPT})
+            stat = Path(src).expanduser().stat()
+        except OSError:
+            keyed.append(str(src))
+            continue
+        keyed.append([str(src), stat.st_mtime_ns, stat.st_size])
+    return keyed
+
+
+def _store_response(cache_key: str, content: Any) -> None:
+    serialized = dump_response(content)
+    if serialized is not None:
+        get_response_cache().set(cache_key, serialized)
+
+
+# Bugs and missing SDKs that retrying or switching models can't fix; they propagate unwrapped.
+# Provider errors are deliberately left broad (SDK exceptions, empty or invalid responses).
+_PROGRAMMING_ERRORS = (NameError, ImportError, NotImplementedError)
+
+
+def _raise_if_last_attempt(
+    error: Exception,
+    current_model: Any,
+    attempt_idx: int,
+    plan: List[Tuple[Any, int]],
+    debug: Optional[bool],
+    last: bool = False
+) -> None:
+    """
+    Log a failed attempt; if it was the last one in plan (or last is set), raise it
+    as an AIError.
+    """
+    if debug:
+        print(f"AI request failed [{current_model}][{attempt_idx}]: {str(error)}")
+    if not last and (current_model, attempt_idx) != plan[-1]:
+        return
+    if isinstance(error, AIError):
+        raise error
+    # Keep the SDK error reachable as __cause__ so callers can branch on its type
+    raise AIError(f"AI request failed: {str(error)}") from error
+
+
+# Shared by every request that uses the default system prompt; never modified
+_DEFAULT_SYSTEM_MESSAGE: Dict[str, Any] = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
+
+def _build_messages(
+    messages: Optional[List[Dict[str, Any]]],
+    system_prompt: Optional[str],
+    additional_system_instructions: Optional[str],
+    user_prompt: Optional[str],
+    ocr_context: str,
+    image_urls: List[str],
+    document_parts: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Assemble the request messages for call_ai.
+    
+    The caller's messages are only scanned when the usual layout (system
+    message first, user/assistant turn last) doesn't answer the question.
+    """
+    messages = messages or []
+    if messages and messages[0].get("role") == "system":
+        system_index = 0
+    else:
+        system_index = next(
+            (i for i, msg in enumerate(messages) if msg.get("role") == "system"), None
+        )
+    has_user_message = bool(messages) and (
+        messages[-1].get("role") in ("user", "assistant")
+        or any(msg.get("role") in ("user", "assistant") for msg in messages)
+    )
+
+    if system_index is None:
+        if not system_prompt and additional_system_instructions is None:
+            system_message = _DEFAULT_SYSTEM_MESSAGE
+        else:
+            # Finish the system prompt before building the list, so it never has to be searched for
+            content = system_prompt or DEFAULT_SYSTEM_PROMPT
             if additional_system_instructions is not None:
-                for msg in final_messages:
-                    if msg.get("role") == "system":
-                        current_content = msg["content"]
-                        if current_content:
-                            msg["content"] = f"{current_content}\n\n{additional_system_instructions}"
-                        break
-
-            if user_prompt is not None:
-                final_messages.append({"role": "user", "content": user_prompt})
-
-            if len(ocr_context) > 0:
-                final_messages.append({"role": "user", "content": f"<content>{ocr_context}</context>"})
-
-            if len(image_urls) > 0:
-                image_parts = [
-                    {"type": "image_url", "image_url": {"url": image_url}}
-                    for image_url in image_urls
-                ]
-                final_messages.append({"role": "user", "content": image_parts})
-
-            if len(document_parts) > 0:
-                final_messages.append({"role": "user", "content": document_parts})
-
-            has_user_message = any(msg.get("role") in ["user", "assistant"] for msg in final_messages)
-            if not has_user_message:
-                final_messages.append({"role": "user", "content": "Please respond based on the instructions."})
-
-            params = {
-                "model": model_name,
-                "messages": final_messages,
-                "temperature": temperature,
-                "top_p": top_p,
-                "tool_choice": tool_choice,
-                "tools": tools,
-                "max_completion_tokens": max_output_tokens,
-                # "reasoning_effort": reasoning_effort,
-                "response_format": response_format,
-            }
-            remove_empty_values(params=params)
-
-            content = None
-            if current_provider == AIProvider.GEMINI:
-                params["use_google_search"] = use_google_search
-                content = get_gemini_response(client, params, debug, raw_response)
-            elif current_provider == AIProvider.OPENAI:
-                content = get_openai_response(client, params, debug, raw_response)
-            else:
-                content = get_chat_completions_response(client, params, debug=debug, raw_response=raw_response)
-            return content
-        except AIError as e:
-            if debug:
-                print(f"AI request failed [{current_model}][{attempt_idx}]: {str(e)}")
-            failure_count += 1
-            if (current_model, attempt_idx) != plan[-1]:
-                sleep_with_backoff(failure_count)
-            else:
-                raise AIError(str(e)) from e
-        except Exception as e:
-            if debug:
-                print(f"AI request failed [{current_model}][{attempt_idx}]: {str(e)}")
-            failure_count += 1
-            if (current_model, attempt_idx) != plan[-1]:
-                sleep_with_backoff(failure_count)
-            else:
-                raise AIError(f"AI request failed: {str(e)}") from e
+                content = f"{content}\n\n{additional_system_instructions}"
+            system_message = {"role": "system", "content": content}
+        final_messages = [system_message, *messages]
+    else:
+        final_messages = list(messages)
+        if additional_system_instructions is not None:
+            current_content = messages[system_index]["content"]
+            if current_content:
+                # Replace rather than mutate, so the caller's message dict is left untouched
+                final_messages[system_index] = {
+                    **messages[system_index],
+                    "content": f"{current_content}\n\n{additional_system_instructions}"
+                }
+
+    if user_prompt is not None:
+        final_messages.append({"role": "user", "content": user_prompt})
+        has_user_message = True
+
+    if len(ocr_context) > 0:
+        final_messages.append({"role": "user", "content": f"<content>{ocr_context}</context>"})
+        has_user_message = True
+
+    if len(image_urls) > 0:
+        image_parts = [
+            {"type": "image_url", "image_url": {"url": image_url}}
+            for image_url in image_urls
+        ]
+        final_messages.append({"role": "user", "content": image_parts})
+        has_user_message = True
+
+    if len(document_parts) > 0:
+        final_messages.append({"role": "user", "content": document_parts})
+        has_user_message = True
+
+    if not has_user_message:
+        final_messages.append({"role": "user", "content": "Please respond based on the instructions."})
+    return final_messages
 
 
 def _precompute_context(
@@ -502,18 +1075,66 @@ def _precompute_context(
         )
 
 
-def get_chat_completions_response(client: OpenAI, params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+def _prime_stream(chunks: Iterator[str], on_token: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+    """
+    Fetch the first chunk eagerly so connection errors are raised inside call_ai's
+    retry loop, then return an iterator over all chunks that also feeds on_token.
+    """
+    chunks = iter(chunks)
+    try:
+        first = next(chunks)
+    except StopIteration:
+        return iter(())
+    chunks = itertools.chain([first], chunks)
+    if on_token is None:
+        return chunks
+    
+    def with_callback():
+        for chunk in chunks:
+            on_token(chunk)
+            yield chunk
+    return with_callback()
+
+
+def _chat_completions_kwargs(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Request kwargs for chat.completions.create, sending prompt_cache_key as a raw body field."""
+    kwargs = dict(params)
+    kwargs.pop("use_google_search", None)
+    prompt_cache_key = kwargs.pop("prompt_cache_key", None)
+    if prompt_cache_key:
+        kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+    return kwargs
+
+
+def get_chat_completions_stream(client: "OpenAI", params: Dict[str, Any], debug: bool = False) -> Iterator[str]:
+    if debug:
+        print_debug_messages(messages=params.get("messages"), params=params)
+    response = client.chat.completions.create(**_chat_completions_kwargs(params), stream=True)
+    for chunk in response:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def get_chat_completions_response(client: "OpenAI", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    if debug:
+        print_debug_messages(messages=params.get("messages"), params=params)
+    response = client.chat.completions.create(**_chat_completions_kwargs(params))
+    return _chat_completions_result(response, params.get("response_format"), raw_response)
+
+
+async def aget_chat_completions_response(client: "AsyncOpenAI", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    """Async version of get_chat_completions_response."""
     if debug:
         print_debug_messages(messages=params.get("messages"), params=params)
-    response = client.chat.completions.create(**params)
+    response = await client.chat.completions.create(**_chat_completions_kwargs(params))
+    return _chat_completions_result(response, params.get("response_format"), raw_response)
+
+
+def _chat_completions_result(response: Any, response_format: Optional[Any], raw_response: bool) -> Any:
     content = response.choices[0].message.content.strip()
-    response_format = params.get("response_format")
     if response_format:
-        if isinstance(content, dict):
-            parsed = content
-        else:
-            parsed = json.loads(content)
-        content = response_format(**parsed)
+        # Let pydantic-core parse and validate the JSON in one native pass
+        content = response_format.model_validate_json(content)
     if raw_response:
         content = FullAiResponse(
             output=content,
@@ -523,13 +1144,95 @@ def get_chat_completions_response(client: OpenAI, params: Dict[str, Any], debug:
     return content
 
 
-def list_models(provider: Optional[AIProvider] = None):
-    client = get_ai_client(provider)
-    models = client.models.list()
+# Request functions per provider, chosen once per model when call_ai/acall_ai resolve it.
+# The None entry covers other OpenAI-compatible providers via chat completions.
+_RESPONSE_FNS: Dict[Optional[AIProvider], Callable[..., Any]] = {
+    AIProvider.GEMINI: get_gemini_response,
+    AIProvider.OPENAI: get_openai_response,
+    None: get_chat_completions_response,
+}
+_ARESPONSE_FNS: Dict[Optional[AIProvider], Callable[..., Any]] = {
+    AIProvider.GEMINI: aget_gemini_response,
+    AIProvider.OPENAI: aget_openai_response,
+    None: aget_chat_completions_response,
+}
+_STREAM_FNS: Dict[Optional[AIProvider], Callable[..., Iterator[str]]] = {
+    AIProvider.GEMINI: get_gemini_stream,
+    AIProvider.OPENAI: get_openai_stream,
+    None: get_chat_completions_stream,
+}
+
+
+def list_models(provider: Optional[AIProvider] = None, refresh: bool = False) -> List[Any]:
+    """
+    List the models available to the configured API key.
+    
+    The catalogue is cached in memory and on disk (~/.aiwand/models_<hash>.json)
+    for 24 hours, keyed by provider and API key.
+    
+    Args:
+        provider: Optional provider to list models for (default: preferred provider)
+        refresh: Ignore cached results and fetch the list from the provider
+        
+    Returns:
+        List of provider model objects
+        
+    Raises:
+        AIError: When no API provider is available
+    """
+    if provider is None:
+        provider = _sole_key_provider()
+    if provider is None:
+        provider, _ = get_preferred_provider_and_model()
+    if not provider:
+        # Raises the usual "No API keys found" error
+        get_ai_client(provider)
+    
+    api_key = os.getenv(ProviderRegistry.get_env_var(provider) or "", "")
+    key_hash = hashlib.sha256(f"{provider.value}:{api_key}".encode("utf-8")).hexdigest()[:16]
+    cache_file = get_config_dir() / f"models_{key_hash}.json"
+    
+    if not refresh:
+        cached = _models_cache.get(key_hash)
+        if cached is not None and time.time() - cached[0] < MODELS_CACHE_TTL_SECONDS:
+            return cached[1]
+        try:
+            fetched_at = cache_file.stat().st_mtime
+            if time.time() - fetched_at < MODELS_CACHE_TTL_SECONDS:
+                if provider == AIProvider.GEMINI:
+                    from google.genai.types import Model as model_class
+                else:
+                    from openai.types import Model as model_class
+                models = [model_class.model_validate(m) for m in json_loads(cache_file.read_bytes())]
+                _models_cache[key_hash] = (fetched_at, models)
+                return models
+        except (OSError, ValueError):
+            pass
+    
+    # Only create the client on a miss; creating it may open a warm-up connection
+    models = list(get_ai_client(provider).models.list())
+    try:
+        cache_file.write_text(json_dumps([m.model_dump(mode="json") for m in models]))
+    except (OSError, TypeError, ValueError):
+        pass
+    _models_cache[key_hash] = (time.time(), models)
     return models
 
 
-def get_ai_client(provider: Optional[AIProvider] = None) -> OpenAI:
+def _sole_key_provider() -> Optional[AIProvider]:
+    """
+    The provider whose API key is the only one set, when no preferences are saved.
+    
+    Preference resolution always lands on that provider in this case, so the
+    common single-key setup can skip it.
+    """
+    available = [p for p, is_set in ProviderRegistry.get_available_providers().items() if is_set]
+    if len(available) != 1 or os.path.exists(get_config_file()):
+        return None
+    return available[0]
+
+
+def get_ai_client(provider: Optional[AIProvider] = None) -> "OpenAI":
     """
     Get configured AI client with smart provider selection.
     
@@ -539,6 +1242,8 @@ def get_ai_client(provider: Optional[AIProvider] = None) -> OpenAI:
     Raises:
         AIError: When no API provider is available
     """
+    if provider is None:
+        provider = _sole_key_provider()
     if provider is None:
         provider, _ = get_preferred_provider_and_model()
     
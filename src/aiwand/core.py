@@ -2,19 +2,90 @@
 Core AI functionality for AIWand
 """
 
-from typing import Optional, List, Dict
-from .config import call_ai, ModelType
+import os
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from .cache import SemanticCache, make_cache_key
+from .config import call_ai, acall_ai, ModelType, _run_async
+from .instrumentation import stage
 from .prompts import (
-    SUMMARIZE_SYSTEM_PROMPT, CHAT_SYSTEM_PROMPT,
+    SUMMARIZE_SYSTEM_PROMPT, SUMMARIZE_STYLE_PROMPTS, CHAT_SYSTEM_PROMPT,
     GENERATE_TEXT_SYSTEM_PROMPT
 )
 
 
+CONCURRENCY_ENV_VAR = "AIWAND_CONCURRENCY"
+DEFAULT_CONCURRENCY = 5
+
+# call_ai's default, set explicitly so SemanticCache.accepts sees the temperature actually used
+SUMMARIZE_TEMPERATURE = 0.7
+
+
+class _PreparedRequest(NamedTuple):
+    """call_ai arguments for one request, plus how to find it in a SemanticCache."""
+    call_kwargs: Dict[str, Any]
+    cache_text: str
+    # Settings the response depends on besides cache_text; only hashed into a
+    # namespace when a SemanticCache is actually used
+    cache_settings: Tuple[Any, ...]
+    temperature: Optional[float] = None
+    
+    @property
+    def cache_namespace(self) -> str:
+        return make_cache_key({"settings": self.cache_settings})
+    
+    @property
+    def function(self) -> str:
+        # cache_settings always starts with the public function's name
+        return self.cache_settings[0]
+
+
+def _run(request: _PreparedRequest, semantic_cache: Optional[SemanticCache]) -> Any:
+    call = partial(call_ai, **request.call_kwargs)
+    with stage(request.function, "ai_call"):
+        if semantic_cache is None:
+            return call()
+        return semantic_cache.get_or_call(
+            request.cache_text, request.cache_namespace, call, temperature=request.temperature
+        )
+
+
+async def _arun(
+    request: _PreparedRequest,
+    semantic_cache: Optional[SemanticCache],
+    semaphore: Optional[asyncio.Semaphore]
+) -> Any:
+    call = partial(acall_ai, **request.call_kwargs)
+    if semantic_cache is not None:
+        call = partial(
+            semantic_cache.aget_or_call,
+            request.cache_text, request.cache_namespace, call, temperature=request.temperature
+        )
+    if semaphore is None:
+        with stage(request.function, "ai_call"):
+            return await call()
+    async with semaphore:
+        # Timed inside the semaphore, so time spent queued is not counted
+        with stage(request.function, "ai_call"):
+            return await call()
+
+
+def _batch_semaphore(max_concurrency: Optional[int]) -> asyncio.Semaphore:
+    """Semaphore for a batch, defaulting to the AIWAND_CONCURRENCY env var."""
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv(CONCURRENCY_ENV_VAR) or DEFAULT_CONCURRENCY)
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return asyncio.Semaphore(max_concurrency)
+
+
 def summarize(
     text: str,
     max_length: Optional[int] = None,
     style: str = "concise",
-    model: Optional[ModelType] = None
+    model: Optional[ModelType] = None,
+    semantic_cache: Optional[SemanticCache] = None
 ) -> str:
     """
     Summarize the given text using AI API (OpenAI or Gemini).
@@ -24,6 +95,8 @@ def summarize(
         max_length (Optional[int]): Maximum length of the summary in words
         style (str): Style of summary ('concise', 'detailed', 'bullet-points')
         model (Optional[ModelType]): Specific model to use (auto-selected if not provided)
+        semantic_cache (Optional[SemanticCache]): Cache to reuse summaries of identical or similar text
+            (summaries use temperature SUMMARIZE_TEMPERATURE; skipped above the cache's max_temperature)
         
     Returns:
         str: The summarized text
@@ -32,24 +105,34 @@ def summarize(
         ValueError: If the text is empty
         AIError: If the API call fails
     """
-    if not text.strip():
+    return _run(_prepare_summarize(text, max_length, style, model), semantic_cache)
+
+
+def _prepare_summarize(
+    text: str,
+    max_length: Optional[int],
+    style: str,
+    model: Optional[ModelType]
+) -> _PreparedRequest:
+    if not text or text.isspace():
         raise ValueError("Text cannot be empty")
     
-    style_prompts = {
-        "concise": "Provide a concise summary of the following text:",
-        "detailed": "Provide a detailed summary of the following text:",
-        "bullet-points": "Summarize the following text in bullet points:"
-    }
-    
-    user_prompt = style_prompts.get(style, style_prompts["concise"])
-    
+    instruction = SUMMARIZE_STYLE_PROMPTS.get(style) or SUMMARIZE_STYLE_PROMPTS["concise"]
     if max_length:
-        user_prompt += f" Keep the summary under {max_length} words."
+        user_prompt = f"{instruction} Keep the summary under {max_length} words.\n\n{text}"
+    else:
+        user_prompt = f"{instruction}\n\n{text}"
     
-    return call_ai(
-        model=model,
-        system_prompt=SUMMARIZE_SYSTEM_PROMPT,
-        user_prompt=f"{user_prompt}\n\n{text}"
+    return _PreparedRequest(
+        call_kwargs=dict(
+            model=model,
+            temperature=SUMMARIZE_TEMPERATURE,
+            system_prompt=SUMMARIZE_SYSTEM_PROMPT,
+            user_prompt=user_prompt
+        ),
+        cache_text=text,
+        cache_settings=("summarize", str(model), instruction, max_length),
+        temperature=SUMMARIZE_TEMPERATURE
     )
 
 
@@ -58,16 +141,20 @@ def chat(
     system_prompt: Optional[str] = None,
     conversation_history: Optional[List[Dict[str, str]]] = None,
     model: Optional[ModelType] = None,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    semantic_cache: Optional[SemanticCache] = None
 ) -> str:
     """
     Have a conversation with the AI (OpenAI or Gemini).
     
     Args:
         message (str): The user's message
-        conversation_history (Optional[List[Dict[str, str]]]): Previous conversation messages
+        conversation_history (Optional[List[Dict[str, str]]]): Previous conversation messages.
+            The list is not modified; append the exchange yourself to continue the conversation.
         model (Optional[ModelType]): Specific model to use (auto-selected if not provided)
         temperature (float): Response creativity (0.0 to 1.0)
+        semantic_cache (Optional[SemanticCache]): Cache to reuse replies to identical or similar
+            messages in the same conversation (skipped above its max_temperature)
         
     Returns:
         str: The AI's response
@@ -76,17 +163,34 @@ def chat(
         ValueError: If the message is empty
         AIError: If the API call fails
     """
-    if not message.strip():
+    return _run(
+        _prepare_chat(message, system_prompt, conversation_history, model, temperature),
+        semantic_cache
+    )
+
+
+def _prepare_chat(
+    message: str,
+    system_prompt: Optional[str],
+    conversation_history: Optional[List[Dict[str, str]]],
+    model: Optional[ModelType],
+    temperature: float
+) -> _PreparedRequest:
+    if not message or message.isspace():
         raise ValueError("Message cannot be empty")
     
-    messages = conversation_history or []
-    
-    return call_ai(
-        messages=messages,
-        temperature=temperature,
-        model=model,
-        system_prompt=system_prompt or CHAT_SYSTEM_PROMPT,
-        user_prompt=message
+    # call_ai copies the history into a new request list, so the caller's list is never modified
+    return _PreparedRequest(
+        call_kwargs=dict(
+            messages=conversation_history,
+            temperature=temperature,
+            model=model,
+            system_prompt=system_prompt or CHAT_SYSTEM_PROMPT,
+            user_prompt=message
+        ),
+        cache_text=message,
+        cache_settings=("chat", str(model), round(temperature, 1), system_prompt, conversation_history or []),
+        temperature=temperature
     )
 
 
@@ -94,7 +198,8 @@ def generate_text(
     prompt: str,
     max_output_tokens: int = None,
     temperature: float = 0.7,
-    model: Optional[ModelType] = None
+    model: Optional[ModelType] = None,
+    semantic_cache: Optional[SemanticCache] = None
 ) -> str:
     """
     Generate text based on a prompt using AI (OpenAI or Gemini).
@@ -104,6 +209,8 @@ def generate_text(
         max_output_tokens (int): Maximum number of tokens to generate
         temperature (float): Response creativity (0.0 to 1.0)
         model (Optional[ModelType]): Specific model to use (auto-selected if not provided)
+        semantic_cache (Optional[SemanticCache]): Cache to reuse results for identical or similar
+            prompts (skipped above its max_temperature)
         
     Returns:
         str: The generated text
@@ -112,13 +219,252 @@ def generate_text(
         ValueError: If the prompt is empty
         AIError: If the API call fails
     """
-    if not prompt.strip():
+    return _run(_prepare_generate_text(prompt, max_output_tokens, temperature, model), semantic_cache)
+
+
+def _prepare_generate_text(
+    prompt: str,
+    max_output_tokens: Optional[int],
+    temperature: float,
+    model: Optional[ModelType]
+) -> _PreparedRequest:
+    if not prompt or prompt.isspace():
         raise ValueError("Prompt cannot be empty")
     
-    return call_ai(
-        max_output_tokens=max_output_tokens,
-        temperature=temperature,
-        model=model,
-        system_prompt=GENERATE_TEXT_SYSTEM_PROMPT,
-        user_prompt=prompt
-    ) 
+    return _PreparedRequest(
+        call_kwargs=dict(
+            max_output_tokens=max_output_tokens,
+            temperature=temperature,
+            model=model,
+            system_prompt=GENERATE_TEXT_SYSTEM_PROMPT,
+            user_prompt=prompt
+        ),
+        cache_text=prompt,
+        cache_settings=("generate_text", str(model), round(temperature, 1), max_output_tokens),
+        temperature=temperature
+    )
+
+
+async def asummarize(
+    text: str,
+    max_length: Optional[int] = None,
+    style: str = "concise",
+    model: Optional[ModelType] = None,
+    semantic_cache: Optional[SemanticCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """
+    Async version of summarize.
+    
+    Args:
+        semaphore: Optional semaphore to cap the number of in-flight requests
+        (all other arguments are the same as summarize)
+        
+    Returns:
+        str: The summarized text
+    """
+    return await _arun(_prepare_summarize(text, max_length, style, model), semantic_cache, semaphore)
+
+
+async def achat(
+    message: str,
+    system_prompt: Optional[str] = None,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    model: Optional[ModelType] = None,
+    temperature: float = 0.7,
+    semantic_cache: Optional[SemanticCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """
+    Async version of chat.
+    
+    Args:
+        semaphore: Optional semaphore to cap the number of in-flight requests
+        (all other arguments are the same as chat)
+        
+    Returns:
+        str: The AI's response
+    """
+    return await _arun(
+        _prepare_chat(message, system_prompt, conversation_history, model, temperature),
+        semantic_cache,
+        semaphore
+    )
+
+
+async def agenerate_text(
+    prompt: str,
+    max_output_tokens: int = None,
+    temperature: float = 0.7,
+    model: Optional[ModelType] = None,
+    semantic_cache: Optional[SemanticCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """
+    Async version of generate_text.
+    
+    Args:
+        semaphore: Optional semaphore to cap the number of in-flight requests
+        (all other arguments are the same as generate_text)
+        
+    Returns:
+        str: The generated text
+    """
+    return await _arun(
+        _prepare_generate_text(prompt, max_output_tokens, temperature, model),
+        semantic_cache,
+        semaphore
+    )
+
+
+async def asummarize_batch(
+    texts: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Async version of summarize_batch.
+    
+    Args:
+        texts: Texts to summarize, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to asummarize (max_length, style, model, ...)
+        
+    Returns:
+        List of summaries in the same order as texts
+    """
+    semaphore = _batch_semaphore(max_concurrency)
+    return await asyncio.gather(
+        *[asummarize(text, semaphore=semaphore, **kwargs) for text in texts],
+        return_exceptions=return_exceptions
+    )
+
+
+def summarize_batch(
+    texts: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Summarize many texts concurrently, one request per text.
+    
+    Args:
+        texts: Texts to summarize, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to summarize (max_length, style, model, ...)
+        
+    Returns:
+        List of summaries in the same order as texts
+        
+    Example:
+        summaries = summarize_batch(articles, style="bullet-points", max_concurrency=10)
+    """
+    return _run_async(asummarize_batch(
+        texts, max_concurrency=max_concurrency, return_exceptions=return_exceptions, **kwargs
+    ))
+
+
+async def achat_batch(
+    messages: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Async version of chat_batch.
+    
+    Args:
+        messages: User messages, each sent as its own request
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to achat (system_prompt, conversation_history, model, ...)
+        
+    Returns:
+        List of replies in the same order as messages
+    """
+    semaphore = _batch_semaphore(max_concurrency)
+    return await asyncio.gather(
+        *[achat(message, semaphore=semaphore, **kwargs) for message in messages],
+        return_exceptions=return_exceptions
+    )
+
+
+def chat_batch(
+    messages: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Send many independent chat messages concurrently, one request per message.
+    
+    Args:
+        messages: User messages, each sent as its own request
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to chat (system_prompt, conversation_history, model, ...)
+        
+    Returns:
+        List of replies in the same order as messages
+    """
+    return _run_async(achat_batch(
+        messages, max_concurrency=max_concurrency, return_exceptions=return_exceptions, **kwargs
+    ))
+
+
+async def agenerate_text_batch(
+    prompts: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Async version of generate_text_batch.
+    
+    Args:
+        prompts: Prompts to generate text from, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to agenerate_text (max_output_tokens, temperature, model, ...)
+        
+    Returns:
+        List of generated texts in the same order as prompts
+    """
+    semaphore = _batch_semaphore(max_concurrency)
+    return await asyncio.gather(
+        *[agenerate_text(prompt, semaphore=semaphore, **kwargs) for prompt in prompts],
+        return_exceptions=return_exceptions
+    )
+
+
+def generate_text_batch(
+    prompts: List[str],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Generate text for many prompts concurrently, one request per prompt.
+    
+    Args:
+        prompts: Prompts to generate text from, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to generate_text (max_output_tokens, temperature, model, ...)
+        
+    Returns:
+        List of generated texts in the same order as prompts
+    """
+    return _run_async(agenerate_text_batch(
+        prompts, max_concurrency=max_concurrency, return_exceptions=return_exceptions, **kwargs
+    ))
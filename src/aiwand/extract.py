@@ -2,15 +2,23 @@
 Extract functionality for AIWand - structured data extraction from any content
 """
 
+import asyncio
 from typing import Optional, List, Union, Any, Dict
 from pydantic import BaseModel
-from .config import call_ai, ModelType
-from .prompts import EXTRACT_SYSTEM_PROMPT
+from .cache import SemanticCache
+from .config import ModelType, _run_async
+from .core import _PreparedRequest, _run, _arun, _batch_semaphore
+from .instrumentation import stage
+from .prompts import EXTRACT_SYSTEM_PROMPT, EXTRACT_JSON_INSTRUCTIONS, EXTRACT_TEXT_INSTRUCTIONS
 from .utils import (
     convert_to_string, string_to_json, fetch_all_data
 )
 
 
+# Rough size of a token, used to turn max_content_tokens into a character budget
+_CHARS_PER_TOKEN = 4
+
+
 def extract(
     content: Optional[Union[str, Any]] = None,
     links: Optional[List[str]] = None,
@@ -22,6 +30,9 @@ def extract(
     system_prompt: Optional[str] = EXTRACT_SYSTEM_PROMPT,
     additional_system_instructions: Optional[str] = None,
     debug: Optional[bool] = False,
+    semantic_cache: Optional[SemanticCache] = None,
+    bypass_cache: Optional[bool] = False,
+    max_content_tokens: Optional[int] = None,
 ) -> Union[str, Dict[str, Any]]:
     """
     Extract structured data from content and/or links using AI.
@@ -41,6 +52,13 @@ def extract(
         response_format: Pydantic model class for structured output.
         system_prompt: Custom system prompt to override the default extraction prompt.
         additional_system_instructions: Any other relavant instructions to help the extraction.
+        semantic_cache: Cache to reuse extractions of identical or similar content
+            (skipped above its max_temperature).
+        bypass_cache: Skip the response cache for this call. Identical extractions are
+            answered from the cache only when the AIWAND_CACHE environment variable is set.
+        max_content_tokens: Optional budget for the content and fetched links, estimated
+            at ~4 characters per token. Longer content is truncated so the request
+            fits the model's context window instead of being rejected.
         
     Returns:
         Union[str, Dict[str, Any]]: Extracted data.
@@ -48,7 +66,7 @@ def extract(
         - Formatted string otherwise
         
     Raises:
-        ValueError: If neither content nor links are provided
+        ValueError: If no content, links, images or document links are provided
         AIError: If the AI call fails
         FileNotFoundError: If file path doesn't exist
         
@@ -76,44 +94,175 @@ def extract(
         data = {"name": "John", "email": "john@example.com"}
         result = extract(content=data)
     """    
-    all_content = []
+    request = _prepare_extract(
+        content, links, document_links, images, model, temperature,
+        response_format, system_prompt, additional_system_instructions, debug, bypass_cache,
+        max_content_tokens
+    )
+    return _finish_extract(_run(request, semantic_cache), response_format)
+
+
+def _prepare_extract(
+    content: Optional[Union[str, Any]],
+    links: Optional[List[str]],
+    document_links: Optional[List[str]],
+    images: Optional[List[str]],
+    model: Optional[ModelType],
+    temperature: float,
+    response_format: Optional[BaseModel],
+    system_prompt: Optional[str],
+    additional_system_instructions: Optional[str],
+    debug: Optional[bool],
+    bypass_cache: Optional[bool],
+    max_content_tokens: Optional[int]
+) -> _PreparedRequest:
+    with stage("extract", "convert_content"):
+        content_str = convert_to_string(content) if content is not None else ""
+    has_content = bool(content_str) and not content_str.isspace()
+    # Reject empty requests before any link is fetched
+    if not (has_content or links or images or document_links):
+        raise ValueError("Provide content, links, images or document_links to extract from")
+    
+    # Collect the prompt as pieces and join once, so large content is copied a single time
+    pieces = [EXTRACT_JSON_INSTRUCTIONS if response_format else EXTRACT_TEXT_INSTRUCTIONS]
+    separator = ""
     
-    if content is not None:
-        content_str = convert_to_string(content)
-        if content_str.strip():
-            all_content.append(f"=== Main Content ===\n{content_str}")
+    if has_content:
+        pieces += ("=== Main Content ===\n", content_str)
+        separator = "\n\n"
     
     if links:
-        links_data = fetch_all_data(links=links)
+        with stage("extract", "fetch_links", n=len(links)):
+            links_data = fetch_all_data(links=links)
         for link_data in links_data:
-            url = link_data.url
-            data = link_data.content
-            all_content.append(f"=== URL {url} ===\n{data}\n")
-        
-    combined_content = "\n\n".join(all_content)
-
-    if response_format:
-        user_prompt = "Return the data as JSON format."    
-    else:
-        user_prompt = (
-            "Use appropriate categories and present the information in a way that's "
-            "easy to understand and use. Include any relevant metadata or context.\n\n"
-        )    
+            pieces += (separator, "=== URL ", link_data.url, " ===\n", link_data.content, "\n")
+            separator = "\n\n"
     
-    user_prompt += f"\n\nExtract relevant structured data from the following content:\n{combined_content}"
+    user_prompt = "".join(pieces)
+    if max_content_tokens is not None:
+        limit = len(pieces[0]) + max_content_tokens * _CHARS_PER_TOKEN
+        if len(user_prompt) > limit:
+            if debug:
+                print(f"Truncating extract content from {len(user_prompt) - len(pieces[0])} to {limit - len(pieces[0])} characters")
+            user_prompt = user_prompt[:limit]
     
-    result = call_ai(
-        system_prompt=system_prompt,
-        model=model,
-        temperature=temperature,
-        response_format=response_format,
-        user_prompt=user_prompt,
-        additional_system_instructions=additional_system_instructions,
-        images=images,
-        document_links=document_links,
-        debug=debug
+    return _PreparedRequest(
+        call_kwargs=dict(
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            response_format=response_format,
+            user_prompt=user_prompt,
+            additional_system_instructions=additional_system_instructions,
+            images=images,
+            document_links=document_links,
+            debug=debug,
+            bypass_cache=bypass_cache
+        ),
+        cache_text=user_prompt,
+        cache_settings=(
+            "extract", str(model), round(temperature, 1), system_prompt, additional_system_instructions,
+            response_format, images, document_links
+        ),
+        temperature=temperature
     )
+
+
+def _finish_extract(result: Any, response_format: Optional[BaseModel]) -> Union[str, Dict[str, Any]]:
     if response_format:
         return result    
-    return string_to_json(result)
+    with stage("extract", "parse_json"):
+        return string_to_json(result)
+
+
+async def aextract(
+    content: Optional[Union[str, Any]] = None,
+    links: Optional[List[str]] = None,
+    document_links: Optional[List[str]] = None,
+    images: Optional[List[str]] = None,
+    model: Optional[ModelType] = None,
+    temperature: float = 0.7,
+    response_format: Optional[BaseModel] = None,
+    system_prompt: Optional[str] = EXTRACT_SYSTEM_PROMPT,
+    additional_system_instructions: Optional[str] = None,
+    debug: Optional[bool] = False,
+    semantic_cache: Optional[SemanticCache] = None,
+    bypass_cache: Optional[bool] = False,
+    max_content_tokens: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> Union[str, Dict[str, Any]]:
+    """
+    Async version of extract.
+    
+    Links are fetched in a worker thread before the request is awaited.
+    
+    Args:
+        semaphore: Optional semaphore to cap the number of in-flight requests
+        (all other arguments are the same as extract)
+        
+    Returns:
+        Union[str, Dict[str, Any]]: Extracted data, as for extract
+    """
+    args = (
+        content, links, document_links, images, model, temperature,
+        response_format, system_prompt, additional_system_instructions, debug, bypass_cache,
+        max_content_tokens
+    )
+    if links:
+        request = await asyncio.to_thread(_prepare_extract, *args)
+    else:
+        request = _prepare_extract(*args)
+    return _finish_extract(await _arun(request, semantic_cache, semaphore), response_format)
+
+
+async def aextract_batch(
+    contents: List[Any],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Async version of extract_batch.
+    
+    Args:
+        contents: Contents to extract from, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to aextract (response_format, model, temperature, ...)
+        
+    Returns:
+        List of extraction results in the same order as contents
+    """
+    semaphore = _batch_semaphore(max_concurrency)
+    return await asyncio.gather(
+        *[aextract(content, semaphore=semaphore, **kwargs) for content in contents],
+        return_exceptions=return_exceptions
+    )
+
 
+def extract_batch(
+    contents: List[Any],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+    **kwargs
+) -> List[Any]:
+    """
+    Extract structured data from many contents concurrently, one request per content.
+    
+    Args:
+        contents: Contents to extract from, one request each
+        max_concurrency: Maximum number of requests in flight at once
+            (default: AIWAND_CONCURRENCY env var, or 5)
+        return_exceptions: Return the error in place of a failed item's result instead of raising
+        **kwargs: Settings passed to extract (response_format, model, temperature, ...)
+        
+    Returns:
+        List of extraction results in the same order as contents
+        
+    Example:
+        contacts = extract_batch(emails, response_format=ContactInfo, max_concurrency=10)
+    """
+    return _run_async(aextract_batch(
+        contents, max_concurrency=max_concurrency, return_exceptions=return_exceptions, **kwargs
+    ))
@@ -0,0 +1,84 @@
+"""
+Lightweight stage timing for AIWand.
+
+Register a callback with set_stage_callback to receive one event per timed
+stage of summarize, chat, generate_text and extract (content conversion, link
+fetching, the AI call, JSON parsing). Events are plain dicts such as
+{"function": "extract", "stage": "fetch_links", "dur_ms": 812.4, "n": 3},
+so they can be forwarded to logging, OpenTelemetry or Prometheus.
+
+With no callback registered, timing is skipped entirely.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+StageCallback = Callable[[Dict[str, Any]], None]
+
+_callback: Optional[StageCallback] = None
+
+
+def set_stage_callback(callback: Optional[StageCallback]) -> Optional[StageCallback]:
+    """
+    Register a callback that receives stage timing events, or None to disable timing.
+
+    Args:
+        callback: Function called with each event dict
+
+    Returns:
+        The previously registered callback, so it can be restored
+
+    Example:
+        timings = []
+        set_stage_callback(timings.append)
+        extract(links=["https://example.com"])
+        # [{"function": "extract", "stage": "fetch_links", "dur_ms": ..., "n": 1}, ...]
+    """
+    global _callback
+    previous = _callback
+    _callback = callback
+    return previous
+
+
+class _NullStage:
+    """Shared no-op stage used while no callback is registered."""
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Times one stage and reports it to the callback on exit."""
+
+    def __init__(self, callback: StageCallback, event: Dict[str, Any]):
+        self.callback = callback
+        self.event = event
+        self.start = 0
+
+    def __enter__(self) -> "_Stage":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.event["dur_ms"] = (time.perf_counter_ns() - self.start) / 1e6
+        if exc_type is not None:
+            self.event["error"] = exc_type.__name__
+        self.callback(self.event)
+
+
+def stage(function: str, name: str, **fields: Any):
+    """
+    Context manager timing one stage of function, e.g. `with stage("extract", "fetch_links", n=3):`.
+    Extra fields are included in the event as-is.
+    """
+    callback = _callback
+    if callback is None:
+        return _NULL_STAGE
+    return _Stage(callback, {"function": function, "stage": name, **fields})
@@ -7,9 +7,14 @@ registry-based system that makes it easy to add new providers and models.
 
 import os
 from enum import Enum
-from typing import Dict, List, Union, Optional, Type, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple, Union, Optional, Type, Any
 from pydantic import BaseModel
-from google.genai import types as gemini_types
+
+if TYPE_CHECKING:
+    # google.genai is slow to import, so it is only loaded once Gemini is used
+    from google.genai import types as gemini_types
 
 
 class AIError(Exception):
@@ -40,6 +45,26 @@ class AIProvider(EnumBaseModel):
     GEMINI = "gemini"
     OPENAI = "openai"
 
+
+# Lookup tables so invalid values can be checked without raising ValueError
+_PROVIDER_BY_VALUE: Dict[str, AIProvider] = {provider.value: provider for provider in AIProvider}
+
+
+@lru_cache(maxsize=16)
+def _availability_mapping(
+    providers: Tuple[AIProvider, ...],
+    present: Tuple[bool, ...]
+) -> Mapping[AIProvider, bool]:
+    """Read-only provider availability mapping for a given API key presence pattern."""
+    return MappingProxyType(dict(zip(providers, present)))
+
+
+@lru_cache(maxsize=None)
+def _model_lookup(model_class: Type[Enum]) -> Dict[str, Enum]:
+    """Map model name strings to members of a model enum."""
+    return {model.value: model for model in model_class}
+
+
 class OpenAIModel(EnumBaseModel):
     """Supported OpenAI models."""
 
@@ -129,8 +154,16 @@ class VideoFileFormat(Enum):
 
 
 class AiSearchResult(BaseModel):
+    # Resolved by _complete_gemini_models() once google.genai has been imported
     text: str
-    grounding_metadata: gemini_types.GroundingMetadata
+    grounding_metadata: "gemini_types.GroundingMetadata"
+
+
+def _complete_gemini_models() -> None:
+    """Resolve the google.genai annotations of models that reference Gemini types."""
+    if not AiSearchResult.__pydantic_complete__:
+        from google.genai import types as gemini_types
+        AiSearchResult.model_rebuild(_types_namespace={"gemini_types": gemini_types})
 
 
 class UsageMetadata(BaseModel):
@@ -166,6 +199,12 @@ class ProviderRegistry:
         AIProvider.GEMINI: GeminiModel.GEMINI_2_0_FLASH,  # Stable, fast model
     }
     
+    # Order in which providers are picked when no preference is configured
+    PROVIDER_PRIORITY: Tuple[AIProvider, ...] = (
+        AIProvider.OPENAI,
+        AIProvider.GEMINI,
+    )
+    
     # Environment variables for API keys
     PROVIDER_ENV_VARS: Dict[AIProvider, str] = {
         AIProvider.OPENAI: "OPENAI_API_KEY",
@@ -178,18 +217,22 @@ class ProviderRegistry:
         AIProvider.GEMINI: "https://generativelanguage.googleapis.com/v1beta/openai/",
     }
     
+    # The registry tables are static, so the listings below are built once
+    # and returned as immutable tuples.
     @classmethod
-    def get_all_providers(cls) -> List[AIProvider]:
-        """Get list of all supported providers."""
-        return list(cls.PROVIDER_MODELS.keys())
+    @lru_cache(maxsize=None)
+    def get_all_providers(cls) -> Tuple[AIProvider, ...]:
+        """Get all supported providers."""
+        return tuple(cls.PROVIDER_MODELS)
     
     @classmethod
-    def get_models_for_provider(cls, provider: AIProvider) -> List[BaseModel]:
+    @lru_cache(maxsize=None)
+    def get_models_for_provider(cls, provider: AIProvider) -> Tuple[BaseModel, ...]:
         """Get all models for a specific provider."""
         model_class = cls.PROVIDER_MODELS.get(provider)
         if model_class:
-            return list(model_class)
-        return []
+            return tuple(_model_lookup(model_class).values())
+        return ()
     
     @classmethod
     def get_default_model(cls, provider: AIProvider) -> Optional[BaseModel]:
@@ -215,36 +258,44 @@ class ProviderRegistry:
         return False
     
     @classmethod
-    def get_available_providers(cls) -> Dict[AIProvider, bool]:
-        """Get availability status for all providers."""
-        return {
-            provider: cls.is_provider_available(provider)
-            for provider in cls.get_all_providers()
-        }
+    def get_available_providers(cls) -> Mapping[AIProvider, bool]:
+        """
+        Get availability status for all providers.
+        
+        The read-only result is reused until the set of API keys present in
+        the environment changes (e.g. after load_dotenv), so repeated calls
+        don't rebuild it.
+        """
+        providers = cls.get_all_providers()
+        present = tuple(
+            bool(os.environ.get(cls.PROVIDER_ENV_VARS.get(provider) or ""))
+            for provider in providers
+        )
+        return _availability_mapping(providers, present)
     
     @classmethod
+    @lru_cache(maxsize=256)
     def infer_provider_from_model(cls, model: ModelType) -> Optional[AIProvider]:
         """
         Infer the AI provider from a model name.
         
+        The model to provider mapping is static, so results are memoized.
+        
         Args:
             model: Model name or enum to check
             
         Returns:
             AIProvider if model belongs to a known provider, None otherwise
         """
-        model_str = str(model).lower()
+        model_name = str(model)
         
-        # First, check exact matches in our registry
+        # First, check exact matches in our registry (original case)
         for provider, model_class in cls.PROVIDER_MODELS.items():
-            try:
-                model_class(str(model))  # Use original case for enum lookup
+            if model_name in _model_lookup(model_class):
                 return provider
-            except ValueError:
-                continue
         
         # If exact match fails, use pattern-based inference as fallback
-        if "gemini" in model_str:
+        if "gemini" in model_name.lower():
             return AIProvider.GEMINI
         
         # Could add more patterns here:
@@ -267,20 +318,30 @@ class ProviderRegistry:
         """
         model_class = cls.PROVIDER_MODELS.get(provider)
         if model_class:
-            try:
-                return model_class(model_str)
-            except ValueError:
-                pass
+            return _model_lookup(model_class).get(model_str)
         return None
+    
+    @classmethod
+    def get_provider_enum(cls, provider_str: str) -> Optional[AIProvider]:
+        """
+        Get the provider enum for a provider string.
+        
+        Args:
+            provider_str: Provider name as string (e.g. "openai")
+            
+        Returns:
+            AIProvider if valid, None otherwise
+        """
+        return _PROVIDER_BY_VALUE.get(provider_str)
 
 
 # Convenience functions for backward compatibility and ease of use
-def get_all_providers() -> List[AIProvider]:
-    """Get list of all supported providers."""
+def get_all_providers() -> Tuple[AIProvider, ...]:
+    """Get all supported providers."""
     return ProviderRegistry.get_all_providers()
 
 
-def get_models_for_provider(provider: AIProvider) -> List[BaseModel]:
+def get_models_for_provider(provider: AIProvider) -> Tuple[BaseModel, ...]:
     """Get all models for a specific provider."""
     return ProviderRegistry.get_models_for_provider(provider)
 
@@ -300,24 +361,27 @@ def is_provider_available(provider: AIProvider) -> bool:
     return ProviderRegistry.is_provider_available(provider)
 
 
-def get_available_providers() -> Dict[AIProvider, bool]:
+def get_available_providers() -> Mapping[AIProvider, bool]:
     """Get availability status for all providers."""
     return ProviderRegistry.get_available_providers()
 
 
-# Legacy compatibility - these functions maintain the old API
-def get_supported_models() -> Dict[AIProvider, List[Union[OpenAIModel, GeminiModel]]]:
+# Legacy compatibility - these functions maintain the old API.
+# The registry is static, so results are built once and returned read-only.
+@lru_cache(maxsize=1)
+def get_supported_models() -> Mapping[AIProvider, Tuple[Union[OpenAIModel, GeminiModel], ...]]:
     """Get supported models for each provider (legacy compatibility)."""
-    return {
+    return MappingProxyType({
         provider: ProviderRegistry.get_models_for_provider(provider)
         for provider in ProviderRegistry.get_all_providers()
-    }
+    })
 
 
-def get_default_models() -> Dict[AIProvider, Union[OpenAIModel, GeminiModel]]:
+@lru_cache(maxsize=1)
+def get_default_models() -> Mapping[AIProvider, Union[OpenAIModel, GeminiModel]]:
     """Get default models for each provider (legacy compatibility)."""
-    return {
+    return MappingProxyType({
         provider: ProviderRegistry.get_default_model(provider)
         for provider in ProviderRegistry.get_all_providers()
         if ProviderRegistry.get_default_model(provider) is not None
-    } 
\ No newline at end of file
+    })
@@ -0,0 +1,208 @@
+"""
+Rate-limit-aware parallel execution of call_ai requests.
+
+This module runs many independent call_ai requests concurrently while staying
+under requests-per-minute and tokens-per-minute limits, following the
+openai-cookbook parallel processor pattern.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .config import acall_ai, _run_async
+from .models import AIError
+from .utils import backoff_delay
+
+
+# Pause applied to every worker after a rate limit error
+RATE_LIMIT_COOLDOWN_SECONDS = 15
+
+
+@dataclass
+class StatusTracker:
+    """Counters describing the progress of a parallel run."""
+    num_tasks_started: int = 0
+    num_tasks_in_progress: int = 0
+    num_tasks_succeeded: int = 0
+    num_tasks_failed: int = 0
+    num_rate_limit_errors: int = 0
+    num_other_errors: int = 0
+    time_of_last_rate_limit_error: Optional[float] = None
+
+
+class _Throttle:
+    """Leaky bucket that refills capacity_per_minute units every minute."""
+
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = capacity_per_minute
+        self.available = capacity_per_minute
+        self.last_update = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity,
+            self.available + self.capacity * (now - self.last_update) / 60.0
+        )
+        self.last_update = now
+
+    def try_consume(self, amount: float) -> bool:
+        """Consume amount if available, returning whether it succeeded."""
+        self._refill()
+        # Allow oversized requests through once the bucket is full
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            self.available -= amount
+            return True
+        return False
+
+
+def _estimate_tokens(job: Dict[str, Any]) -> int:
+    """Roughly estimate the tokens a call_ai job will consume (~4 characters per token)."""
+    chars = 0
+    for key in ("system_prompt", "user_prompt", "additional_system_instructions"):
+        value = job.get(key)
+        if value:
+            chars += len(value)
+    for message in job.get("messages") or []:
+        chars += len(str(message.get("content", "")))
+    return chars // 4 + (job.get("max_output_tokens") or 0)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "resource_exhausted" in message
+
+
+async def arun_parallel(
+    jobs: List[Dict[str, Any]],
+    max_requests_per_minute: float = 500,
+    max_tokens_per_minute: float = 90000,
+    max_attempts: int = 3,
+    max_concurrent: int = 50,
+    return_exceptions: bool = False,
+    status: Optional[StatusTracker] = None
+) -> List[Any]:
+    """
+    Async version of run_parallel.
+
+    Args:
+        jobs: List of keyword argument dicts, each passed to acall_ai. Unless a job sets
+            them, retries=0 and fallback_models=[] are used, so max_attempts and the
+            rate limits apply to every request made
+        max_requests_per_minute: Requests-per-minute limit to stay under
+        max_tokens_per_minute: Tokens-per-minute limit to stay under (estimated)
+        max_attempts: Attempts per job before giving up
+        max_concurrent: Maximum number of requests in flight at once
+        return_exceptions: Return the error in place of a failed job's result instead of raising
+        status: Optional StatusTracker to collect progress counters
+
+    Returns:
+        List of call_ai results in the same order as jobs
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    status = status if status is not None else StatusTracker()
+    request_throttle = _Throttle(max_requests_per_minute)
+    token_throttle = _Throttle(max_tokens_per_minute)
+    lock = asyncio.Lock()
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire_capacity(token_estimate: int) -> None:
+        while True:
+            async with lock:
+                cooldown_left = 0.0
+                if status.time_of_last_rate_limit_error is not None:
+                    cooldown_left = (
+                        status.time_of_last_rate_limit_error + RATE_LIMIT_COOLDOWN_SECONDS - time.monotonic()
+                    )
+                if cooldown_left <= 0 and request_throttle.try_consume(1):
+                    if token_throttle.try_consume(token_estimate):
+                        return
+                    # Give the request slot back until tokens are available
+                    request_throttle.available += 1
+            await asyncio.sleep(max(0.05, cooldown_left))
+
+    async def run_job(job: Dict[str, Any]) -> Any:
+        token_estimate = _estimate_tokens(job)
+        # Attempts are made (and throttled) here, so each one is a single request to a single model
+        job = {"retries": 0, "fallback_models": [], **job}
+        async with semaphore:
+            status.num_tasks_started += 1
+            status.num_tasks_in_progress += 1
+            try:
+                for attempt in range(1, max_attempts + 1):
+                    await acquire_capacity(token_estimate)
+                    try:
+                        result = await acall_ai(**job)
+                        status.num_tasks_succeeded += 1
+                        return result
+                    except Exception as e:
+                        rate_limited = _is_rate_limit_error(e)
+                        if rate_limited:
+                            status.num_rate_limit_errors += 1
+                            status.time_of_last_rate_limit_error = time.monotonic()
+                        else:
+                            status.num_other_errors += 1
+                        if attempt == max_attempts:
+                            status.num_tasks_failed += 1
+                            if isinstance(e, AIError):
+                                raise
+                            raise AIError(f"AI request failed: {str(e)}") from e
+                        # Rate limit errors already wait out the shared cooldown
+                        if not rate_limited:
+                            await asyncio.sleep(backoff_delay(attempt))
+            finally:
+                status.num_tasks_in_progress -= 1
+
+    return await asyncio.gather(
+        *[run_job(job) for job in jobs],
+        return_exceptions=return_exceptions
+    )
+
+
+def run_parallel(
+    jobs: List[Dict[str, Any]],
+    max_requests_per_minute: float = 500,
+    max_tokens_per_minute: float = 90000,
+    max_attempts: int = 3,
+    max_concurrent: int = 50,
+    return_exceptions: bool = False,
+    status: Optional[StatusTracker] = None
+) -> List[Any]:
+    """
+    Run many call_ai requests concurrently within rate limits.
+
+    Args:
+        jobs: List of keyword argument dicts, each passed to acall_ai (see arun_parallel)
+        max_requests_per_minute: Requests-per-minute limit to stay under
+        max_tokens_per_minute: Tokens-per-minute limit to stay under (estimated)
+        max_attempts: Attempts per job before giving up
+        max_concurrent: Maximum number of requests in flight at once
+        return_exceptions: Return the error in place of a failed job's result instead of raising
+        status: Optional StatusTracker to collect progress counters
+
+    Returns:
+        List of call_ai results in the same order as jobs
+
+    Raises:
+        AIError: If a job fails after max_attempts and return_exceptions is False
+
+    Example:
+        results = run_parallel([
+            {"user_prompt": "Summarize A"},
+            {"user_prompt": "Summarize B", "model": "gpt-4o"},
+        ], max_requests_per_minute=60)
+    """
+    return _run_async(arun_parallel(
+        jobs,
+        max_requests_per_minute=max_requests_per_minute,
+        max_tokens_per_minute=max_tokens_per_minute,
+        max_attempts=max_attempts,
+        max_concurrent=max_concurrent,
+        return_exceptions=return_exceptions,
+        status=status
+    ))
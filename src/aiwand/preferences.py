@@ -6,9 +6,12 @@ and preference-related utilities.
 """
 
 import os
+import copy
 import json
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 
 from .models import (
     AIError,
@@ -17,75 +20,195 @@ from .models import (
     GeminiModel,
     ProviderRegistry,
 )
+from .utils.json_utils import json_dumpb, json_loads
 
 
-def get_config_dir() -> Path:
-    """Get the AIWand configuration directory."""
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create path if needed; only hits the filesystem once per path."""
+    path.mkdir(exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=8)
+def _config_paths(home: Optional[str], user_profile: Optional[str]) -> Tuple[Path, Path, str]:
+    """
+    Config directory and file paths for a given home directory environment,
+    plus the file path as a plain string for the os-level read path.
+    """
     config_dir = Path.home() / ".aiwand"
-    config_dir.mkdir(exist_ok=True)
-    return config_dir
+    config_file = config_dir / "config.json"
+    return config_dir, config_file, str(config_file)
+
+
+def _current_config_paths() -> Tuple[Path, Path, str]:
+    # Path.home() follows HOME (USERPROFILE on Windows), so key on those to
+    # stay correct when they change at runtime
+    return _config_paths(os.environ.get("HOME"), os.environ.get("USERPROFILE"))
+
+
+def _config_dir_path() -> Path:
+    """Path of the AIWand configuration directory, without creating it."""
+    return _current_config_paths()[0]
+
+
+def get_config_dir() -> Path:
+    """Get the AIWand configuration directory, creating it if needed."""
+    return _ensure_dir(_config_dir_path())
 
 
 def get_config_file() -> Path:
-    """Get the path to the configuration file."""
-    return get_config_dir() / "config.json"
+    """
+    Get the path to the configuration file.
+    
+    The directory is not created here; reads treat a missing file as empty
+    preferences and save_user_preferences creates it on first write.
+    """
+    return _current_config_paths()[1]
 
 
-def load_user_preferences() -> Dict[str, Any]:
-    """Load user preferences from config file."""
-    config_file = get_config_file()
-    if config_file.exists():
+# Parsed config file, keyed by the file's (mtime, size) when it was read
+_prefs_cache: Dict[str, Any] = {}
+_prefs_stamp: Optional[Tuple[int, int]] = None
+
+
+def _cached_preferences() -> Dict[str, Any]:
+    """
+    Return the parsed config file, re-reading it only when its modification
+    time or size changed. The returned dict is shared and must not be modified.
+    """
+    global _prefs_cache, _prefs_stamp
+    # Plain os calls on the string path skip pathlib overhead on every AI request
+    config_file = _current_config_paths()[2]
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        # No config file (or it was deleted): forget the old contents and stamp, so
+        # get_preferred_provider_and_model doesn't keep serving the deleted settings
+        _prefs_cache, _prefs_stamp = {}, None
+        return _prefs_cache
+    
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if stamp != _prefs_stamp:
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                preferences = json_loads(f.read())
         except (json.JSONDecodeError, IOError):
             # If config is corrupted, return empty dict
-            pass
-    return {}
+            preferences = {}
+        _prefs_cache, _prefs_stamp = preferences, stamp
+    return _prefs_cache
+
+
+def load_user_preferences() -> Dict[str, Any]:
+    """
+    Load user preferences from config file.
+    
+    The parsed file is cached and only re-read when it changes on disk, so
+    repeated calls don't hit the disk.
+    """
+    # Callers may modify the result, so hand out a copy of the cached data
+    return copy.deepcopy(_cached_preferences())
 
 
 def save_user_preferences(preferences: Dict[str, Any]) -> None:
     """Save user preferences to config file."""
+    global _prefs_cache, _prefs_stamp
     config_file = get_config_file()
+    _prefs_stamp = None
     try:
-        with open(config_file, 'w') as f:
-            json.dump(preferences, f, indent=2)
+        data = json_dumpb(preferences, indent=True)
+        # Write to a temporary file and swap it in, so readers never see a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=config_file.parent, prefix=".config-", suffix=".json")
+        except FileNotFoundError:
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=config_file.parent, prefix=".config-", suffix=".json")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # Prime the cache with what was just written so the next load skips the disk
+        stat = config_file.stat()
+        _prefs_cache = copy.deepcopy(preferences)
+        _prefs_stamp = (stat.st_mtime_ns, stat.st_size)
     except IOError as e:
         raise AIError(f"Failed to save preferences: {e}")
 
 
+# Last resolved (provider, model), keyed by everything the resolution depends on
+_preferred_cache: Optional[Tuple[Any, Tuple[Optional[AIProvider], Any]]] = None
+
+
+def invalidate_preferences_cache() -> None:
+    """
+    Drop the cached config file contents and the resolved preferred provider/model.
+    
+    The caches already refresh when the config file is changed or removed, or
+    when API keys or AI_DEFAULT_PROVIDER change; this forces a re-read
+    regardless, e.g. when a file was replaced with identical size within the
+    filesystem's timestamp resolution.
+    """
+    global _prefs_cache, _prefs_stamp, _preferred_cache
+    _prefs_cache, _prefs_stamp = {}, None
+    _preferred_cache = None
+
+
 def get_preferred_provider_and_model() -> Tuple[Optional[AIProvider], Optional[Union[OpenAIModel, GeminiModel]]]:
-    """Get user's preferred provider and model from preferences."""
-    preferences = load_user_preferences()
+    """
+    Get user's preferred provider and model from preferences.
+    
+    The result is reused until the config file, the available API keys or
+    AI_DEFAULT_PROVIDER change.
+    """
+    global _preferred_cache
+    preferences = _cached_preferences()
     available_providers = ProviderRegistry.get_available_providers()
+    env_provider = os.environ.get("AI_DEFAULT_PROVIDER", "")
     
+    # The environment is read live (keys may be loaded or rotated after import),
+    # but the raw values are compared as-is and only normalized on a cache miss.
+    # The availability mapping is itself cached, so it usually matches by identity.
+    cache_key = (_prefs_stamp, available_providers, env_provider)
+    if _preferred_cache is not None and _preferred_cache[0] == cache_key:
+        return _preferred_cache[1]
+    
+    result = _resolve_preferred_provider_and_model(preferences, available_providers, env_provider.lower())
+    _preferred_cache = (cache_key, result)
+    return result
+
+
+def _resolve_preferred_provider_and_model(
+    preferences: Dict[str, Any],
+    available_providers: Mapping[AIProvider, bool],
+    env_provider: str
+) -> Tuple[Optional[AIProvider], Optional[Union[OpenAIModel, GeminiModel]]]:
+    """Pick the provider and model from preferences, AI_DEFAULT_PROVIDER and available keys."""
     # Get preferred provider
     preferred_provider_str = preferences.get("default_provider")
     preferred_provider = None
     
     if preferred_provider_str:
-        try:
-            preferred_provider = AIProvider(preferred_provider_str)
-        except ValueError:
-            preferred_provider = None
+        preferred_provider = ProviderRegistry.get_provider_enum(preferred_provider_str)
     
     # If preferred provider is not available, fall back to available ones
     if not preferred_provider or not available_providers.get(preferred_provider):
         # Check environment variable
-        env_provider = os.getenv("AI_DEFAULT_PROVIDER", "").lower()
-        try:
-            env_provider_enum = AIProvider(env_provider)
-            if available_providers.get(env_provider_enum):
-                preferred_provider = env_provider_enum
-        except ValueError:
-            pass
+        env_provider_enum = ProviderRegistry.get_provider_enum(env_provider)
+        if env_provider_enum and available_providers.get(env_provider_enum):
+            preferred_provider = env_provider_enum
         
         if not preferred_provider:
-            # Use first available provider
-            for provider, available in available_providers.items():
-                if available:
-                    preferred_provider = provider
-                    break
+            # Use the highest-priority available provider
+            preferred_provider = next(
+                (p for p in ProviderRegistry.PROVIDER_PRIORITY if available_providers.get(p)),
+                None
+            )
     
     if not preferred_provider:
         return None, None
@@ -15,6 +15,12 @@ CHAT_SYSTEM_PROMPT = (
     "You are friendly, professional, and adapt your tone to match the user's needs."
 )
 
+SUMMARIZE_STYLE_PROMPTS = {
+    "concise": "Provide a concise summary of the following text:",
+    "detailed": "Provide a detailed summary of the following text:",
+    "bullet-points": "Summarize the following text in bullet points:"
+}
+
 GENERATE_TEXT_SYSTEM_PROMPT = (
     "You are a skilled creative writer and content generator."
     "You excel at producing high-quality, engaging, and contextually appropriate text based on user prompts."
@@ -30,6 +36,19 @@ EXTRACT_SYSTEM_PROMPT = (
     "return the data as JSON format."
 )
 
+# Fixed user prompt instructions for extract; they precede the variable content
+# so consecutive requests share as long a prompt prefix as possible
+EXTRACT_JSON_INSTRUCTIONS = (
+    "Return the data as JSON format."
+    "\n\nExtract relevant structured data from the following content:\n"
+)
+
+EXTRACT_TEXT_INSTRUCTIONS = (
+    "Use appropriate categories and present the information in a way that's "
+    "easy to understand and use. Include any relevant metadata or context.\n\n"
+    "\n\nExtract relevant structured data from the following content:\n"
+)
+
 OCR_SYSTEM_PROMPT = f"""You are an document conversion system. 
 Extract all text from the provided document accurately, preserving the original formatting, structure, and layout as much as possible. 
 Follow belo Instructions:
@@ -4,7 +4,9 @@ Interactive setup and configuration display for AIWand.
 This module provides user-facing setup utilities and configuration display functions.
 """
 
-from .models import AIError, AIProvider, ProviderRegistry
+from typing import Any, Dict, Optional, Sequence, TypeVar, Union
+
+from .models import AIError, AIProvider, GeminiModel, OpenAIModel, ProviderRegistry
 from .preferences import (
     load_user_preferences,
     save_user_preferences,
@@ -13,6 +15,25 @@ from .preferences import (
 )
 
 
+T = TypeVar("T")
+
+
+def _prompt_choice(options: Sequence[T], current: Optional[T]) -> T:
+    """
+    Ask for a numbered choice until a valid one is entered.
+    Pressing Enter keeps current, when there is one.
+    """
+    prompt = f"\nEnter choice (1-{len(options)}) or press Enter to keep current: "
+    valid_choices = {str(i): option for i, option in enumerate(options, 1)}
+    while True:
+        choice = input(prompt).strip()
+        if not choice and current is not None:
+            return current
+        if choice in valid_choices:
+            return valid_choices[choice]
+        print("Invalid choice. Please try again.")
+
+
 def setup_user_preferences() -> None:
     """Interactive setup for user preferences."""
     print("🪄 AIWand Setup")
@@ -50,20 +71,12 @@ def setup_user_preferences() -> None:
         marker = " (current)" if provider.value == current_provider_str else ""
         print(f"  {i}. {provider.value.title()}{marker}")
     
-    while True:
-        try:
-            choice = input(f"\nEnter choice (1-{len(available_list)}) or press Enter to keep current: ").strip()
-            if not choice and current_provider_str:
-                chosen_provider_enum = AIProvider(current_provider_str)
-                break
-            elif choice.isdigit() and 1 <= int(choice) <= len(available_list):
-                chosen_provider_enum = available_list[int(choice) - 1]
-                break
-            else:
-                print("Invalid choice. Please try again.")
-        except KeyboardInterrupt:
-            print("\n\nSetup cancelled.")
-            return
+    current_provider_enum = ProviderRegistry.get_provider_enum(current_provider_str or "")
+    try:
+        chosen_provider_enum = _prompt_choice(available_list, current_provider_enum)
+    except KeyboardInterrupt:
+        print("\n\nSetup cancelled.")
+        return
     
     # Choose model for the provider
     supported_models = ProviderRegistry.get_models_for_provider(chosen_provider_enum)
@@ -84,29 +97,14 @@ def setup_user_preferences() -> None:
             marker += " (recommended)"
         print(f"  {i}. {model.value}{marker}")
     
-    while True:
-        try:
-            choice = input(f"\nEnter choice (1-{len(supported_models)}) or press Enter to keep current: ").strip()
-            if not choice:
-                chosen_model_enum = current_model_enum
-                break
-            elif choice.isdigit() and 1 <= int(choice) <= len(supported_models):
-                chosen_model_enum = supported_models[int(choice) - 1]
-                break
-            else:
-                print("Invalid choice. Please try again.")
-        except KeyboardInterrupt:
-            print("\n\nSetup cancelled.")
-            return
-    
-    # Save preferences
-    new_preferences = {
-        "default_provider": chosen_provider_enum.value,
-        "models": {
-            **current_models,
-            chosen_provider_enum.value: chosen_model_enum.value
-        }
-    }
+    try:
+        chosen_model_enum = _prompt_choice(supported_models, current_model_enum)
+    except KeyboardInterrupt:
+        print("\n\nSetup cancelled.")
+        return
+    
+    # Save preferences (updating the loaded dict keeps any other settings in it)
+    new_preferences = _apply_choice(current_prefs, chosen_provider_enum, chosen_model_enum)
     
     try:
         save_user_preferences(new_preferences)
@@ -119,6 +117,17 @@ def setup_user_preferences() -> None:
         print(f"\n❌ Error saving preferences: {e}")
 
 
+def _apply_choice(
+    preferences: Dict[str, Any],
+    provider: AIProvider,
+    model: Union[OpenAIModel, GeminiModel]
+) -> Dict[str, Any]:
+    """Record the chosen default provider and its model in preferences, in place."""
+    preferences["default_provider"] = provider.value
+    preferences.setdefault("models", {})[provider.value] = model.value
+    return preferences
+
+
 def show_current_config() -> None:
     """Display current configuration and preferences."""
     print("🪄 AIWand Configuration")
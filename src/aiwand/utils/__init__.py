@@ -2,6 +2,7 @@ from .extras import *
 from .web_utils import *
 from .file_utils import *
 from .funcs import *
+from .json_utils import *
 
 from .gemini_utils import *
 from .openai_llm_utils import *
\ No newline at end of file
@@ -1,10 +1,24 @@
 import json
 import pathlib
+import hashlib
+import functools
 import mimetypes
 import base64
 import urllib
 import copy
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .json_utils import json_dumps, json_loads
+
+_json_decoder = json.JSONDecoder()
+
+# Body of a ```json (or bare ```) fenced block
+_JSON_FENCE_RE = re.compile(r"```(?:json)?[ \t]*\n?(.*?)```", re.DOTALL | re.IGNORECASE)
+
+# Read size for streamed base64 encoding; a multiple of 3 so chunks encode without padding
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
 
 def convert_to_string(content: Any) -> str:
     """Convert any content to string representation."""
@@ -12,19 +26,50 @@ def convert_to_string(content: Any) -> str:
         return content
     elif isinstance(content, (dict, list)):
         try:
-            return json.dumps(content, indent=2, ensure_ascii=False)
+            return json_dumps(content, indent=True)
         except (TypeError, ValueError):
             return str(content)
+    elif isinstance(content, bytes):
+        return content.decode("utf-8", "replace")
     else:
         return str(content)
     
-def string_to_json(content: str) -> dict:
-    """Clean the JSON response from the AI."""
-    try:
-        cleaned = content.strip("`").split("\n", 1)[1].rsplit("\n", 1)[0]
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
-        return content
+def string_to_json(content: Union[str, bytes]) -> dict:
+    """
+    Parse the JSON in an AI response, returning content unchanged if there is none.
+    
+    Handles bare JSON, ```json fenced blocks and JSON preceded by prose. The JSON
+    must run to the end of the (fence-stripped) text, so prose that merely
+    contains a JSON-like fragment, such as a "[1]" citation, is returned as-is.
+    Bytes are parsed directly when they are bare JSON, and decoded as UTF-8 otherwise.
+    """
+    if isinstance(content, (bytes, bytearray)):
+        try:
+            return json_loads(content)
+        except ValueError:
+            content = content.decode("utf-8", "replace")
+    text = content.strip()
+    if text[:1] in ("{", "["):
+        try:
+            return json_loads(text)
+        except ValueError:
+            pass
+    fenced = _JSON_FENCE_RE.search(text)
+    if fenced is not None:
+        text = fenced.group(1).strip()
+    # Decode from each object/array start; only accept a value with nothing but
+    # whitespace after it, so fragments inside prose aren't mistaken for the result
+    start = min((i for i in (text.find("{"), text.find("[")) if i != -1), default=-1)
+    while start != -1:
+        try:
+            value, end = _json_decoder.raw_decode(text, start)
+            if not text[end:].strip():
+                return value
+        except ValueError:
+            pass
+        start = min((i for i in (text.find("{", start + 1), text.find("[", start + 1)) if i != -1), default=-1)
+    return content
+
 
 def is_url(link: str) -> bool:
     """Check if a link is a URL (starts with http/https)."""
@@ -44,17 +89,76 @@ def image_to_data_url(src: str | pathlib.Path | bytes) -> str:
             # Fallback if data URL parsing fails
             raw, mime = src.encode(), "image/png"
     elif isinstance(src, str) and src.startswith("http"):
-        with urllib.request.urlopen(src) as response:
-            raw = response.read()
-            mime = response.headers.get_content_type()
+        return _remote_image_data_url(src)
     else:
-        path = pathlib.Path(src).expanduser()
-        raw = path.read_bytes()
-        mime = mimetypes.guess_type(path.name)[0] or "image/png"
+        return _local_file_data_url(src, "image/png")
     b64 = base64.b64encode(raw).decode()
     return f"data:{mime};base64,{b64}"
 
 
+def _encode_data_url(chunks: Iterable[bytes], mime: str) -> str:
+    """Base64-encode chunks into a data URL without holding the whole raw payload."""
+    out = bytearray(f"data:{mime};base64,".encode())
+    pending = b""
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 3
+        out += base64.b64encode(chunk[:usable])
+        pending = chunk[usable:]
+    out += base64.b64encode(pending)
+    return out.decode("ascii")
+
+
+def _local_file_data_url(src: str | pathlib.Path, default_mime: str) -> str:
+    path = pathlib.Path(src).expanduser()
+    stat = path.stat()
+    mime = mimetypes.guess_type(path.name)[0] or default_mime
+    return _encode_local_file(str(path), stat.st_mtime_ns, stat.st_size, mime)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_local_file(path: str, mtime_ns: int, size: int, mime: str) -> str:
+    """Encode a local file once per (mtime, size); an edited file gets a new cache entry."""
+    with open(path, "rb") as f:
+        return _encode_data_url(iter(functools.partial(f.read, _B64_CHUNK_SIZE), b""), mime)
+
+
+def _blob_path(url: str) -> Optional[pathlib.Path]:
+    """Path of the on-disk data URL cache entry for url, or None if caching is disabled."""
+    from ..cache import is_cache_enabled
+    from ..preferences import get_config_dir
+    
+    if not is_cache_enabled():
+        return None
+    blob_dir = get_config_dir() / "blobs"
+    blob_dir.mkdir(exist_ok=True)
+    return blob_dir / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _cached_remote_data_url(url: str, download) -> str:
+    """Return the data URL for url from the blob cache, downloading it on a miss."""
+    blob_path = _blob_path(url)
+    if blob_path is not None and blob_path.exists():
+        return blob_path.read_text()
+    data_url = download(url)
+    if blob_path is not None:
+        blob_path.write_text(data_url)
+    return data_url
+
+
+def _download_image_data_url(url: str) -> str:
+    with urllib.request.urlopen(url) as response:
+        mime = response.headers.get_content_type()
+        return _encode_data_url(iter(functools.partial(response.read, _B64_CHUNK_SIZE), b""), mime)
+
+
+@functools.lru_cache(maxsize=256)
+def _remote_image_data_url(url: str) -> str:
+    """Fetch and encode a remote image once per process (and once per machine with AIWAND_CACHE)."""
+    return _cached_remote_data_url(url, _download_image_data_url)
+
+
 def document_to_data_url(src: str | pathlib.Path | bytes) -> str:
     """Convert document to data URL, handling binary data, URLs, and file paths."""
     if isinstance(src, bytes):
@@ -69,25 +173,33 @@ def document_to_data_url(src: str | pathlib.Path | bytes) -> str:
             # Fallback if data URL parsing fails
             raw, mime = src.encode(), "application/pdf"
     elif isinstance(src, str) and src.startswith("http"):
-        import httpx
-        try:
-            response = httpx.get(src)
-            raw = response.content
-            # Try to get mime type from response headers or guess from URL
-            mime = response.headers.get('content-type', '').split(';')[0]
-            if not mime:
-                mime = mimetypes.guess_type(src)[0] or "application/pdf"
-        except Exception as e:
-            raise ValueError(f"Error fetching document from {src}: {str(e)}")
+        return _remote_document_data_url(src)
     else:
-        path = pathlib.Path(src).expanduser()
-        raw = path.read_bytes()
-        mime = mimetypes.guess_type(path.name)[0] or "application/pdf"
+        return _local_file_data_url(src, "application/pdf")
     
     b64 = base64.b64encode(raw).decode()
     return f"data:{mime};base64,{b64}"
 
 
+def _download_document_data_url(url: str) -> str:
+    import httpx
+    try:
+        with httpx.stream("GET", url) as response:
+            # Try to get mime type from response headers or guess from URL
+            mime = response.headers.get('content-type', '').split(';')[0]
+            if not mime:
+                mime = mimetypes.guess_type(url)[0] or "application/pdf"
+            return _encode_data_url(response.iter_bytes(_B64_CHUNK_SIZE), mime)
+    except Exception as e:
+        raise ValueError(f"Error fetching document from {url}: {str(e)}")
+
+
+@functools.lru_cache(maxsize=256)
+def _remote_document_data_url(url: str) -> str:
+    """Fetch and encode a remote document once per process (and once per machine with AIWAND_CACHE)."""
+    return _cached_remote_data_url(url, _download_document_data_url)
+
+
 def _detect_image_mime_type(data: bytes) -> str:
     """Detect image MIME type from raw bytes using magic numbers."""
     if data.startswith(b'\xff\xd8\xff'):
@@ -158,7 +270,7 @@ def print_debug_messages(messages: List[Dict[str, Any]], params: Dict[str, Any])
                     content["image_url"]["url"] = "<IMAGE_URLs>"
                 elif content_type == "input_file":
                     content["file_data"] = "<FILE_URLs>"
-    print(json.dumps(copied_messages, indent=2))
+    print(json_dumps(copied_messages, indent=True))
     for k, v in params.items():
         if k != "messages":
             print(f"{k}: {v}\n")
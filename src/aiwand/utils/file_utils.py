@@ -1,7 +1,18 @@
-import urllib
+import urllib.parse
 import os
 
+_REMOTE_PREFIXES = ("http://", "https://")
+_LOCAL_PREFIXES = ("file:", "relative:")
+
+
 def is_remote_url(path: str) -> bool:
+    # Common cases are decided by prefix, without tokenizing the whole URL
+    head = path[:9].lower()
+    if head.startswith(_REMOTE_PREFIXES):
+        return True
+    if head.startswith(_LOCAL_PREFIXES):
+        return False
+
     parsed = urllib.parse.urlparse(path)
 
     # Rule 1: Has a remote scheme like http or https
@@ -3,16 +3,23 @@ import time
 from functools import wraps
 
 
-def sleep_with_backoff(attempt: int, base: float = 0.5, cap: float = 16.0) -> None:
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 16.0) -> float:
     """
-    Exponential backoff with jitter.
+    Exponential backoff delay with jitter, in seconds.
     attempt: 0-based attempt index
     base: initial delay seconds
     cap: max delay seconds
     """
     delay = min(cap, base * (2 ** attempt))
     jitter = delay * (random.random() * 0.5 - 0.25)
-    time.sleep(max(0.05, delay + jitter))
+    return max(0.05, delay + jitter)
+
+
+def sleep_with_backoff(attempt: int, base: float = 0.5, cap: float = 16.0) -> None:
+    """
+    Sleep for an exponential backoff delay with jitter (see backoff_delay).
+    """
+    time.sleep(backoff_delay(attempt, base=base, cap=cap))
 
 def retry(max_retries=3, delay=1, exceptions=(Exception,)):
     """
@@ -1,23 +1,26 @@
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Iterator, Tuple
+import copy
 import base64
 import re
 import mimetypes
-from google.genai import (
-    client as gemini_client,
-    types as gemini_types
-)
 from pydantic import BaseModel
 
 from .extras import remove_empty_values, print_debug_messages
-from .llm_utils import get_system_msg
+from .llm_utils import get_system_msg, get_json_schema
 from .web_utils import fetch_doc
-from ..models import AiSearchResult, FullAiResponse, UsageMetadata
+from ..models import AiSearchResult, FullAiResponse, UsageMetadata, _complete_gemini_models
 
+if TYPE_CHECKING:
+    # google.genai is imported where it is used, so importing aiwand stays fast
+    from google.genai import Client as GeminiClient, types as gemini_types
 
-def get_gemini_config(params: Dict[str, Any]) -> gemini_types.GenerateContentConfig:
+
+def get_gemini_config(params: Dict[str, Any]) -> "gemini_types.GenerateContentConfig":
     """
     Get configuration for the Gemini API.
     """
+    from google.genai import types as gemini_types
+
     config_dict = {
         "temperature": params.get("temperature"),
         "top_p": params.get("top_p"),
@@ -45,7 +48,8 @@ def get_gemini_config(params: Dict[str, Any]) -> gemini_types.GenerateContentCon
     # Handle structured output
     response_format: Optional[BaseModel] = params.get("response_format")
     if response_format:
-        config_dict["response_schema"] = response_format.model_json_schema()
+        # The SDK normalizes dict schemas in place, so give it a copy of the cached one
+        config_dict["response_schema"] = copy.deepcopy(get_json_schema(response_format))
         config_dict["response_mime_type"] = "application/json"
     
     # Remove empty values and create config
@@ -80,7 +84,7 @@ def _parse_data_url(data_url: str) -> tuple[bytes, str]:
         raise ValueError(f"Failed to decode base64 data: {e}")
 
 
-def _convert_content_to_parts(content: Any) -> List[gemini_types.Part]:
+def _convert_content_to_parts(content: Any) -> List["gemini_types.Part"]:
     """
     Convert OpenAI-style content to Gemini Parts.
     
@@ -90,6 +94,8 @@ def _convert_content_to_parts(content: Any) -> List[gemini_types.Part]:
     Returns:
         List of Gemini Parts
     """
+    from google.genai import types as gemini_types
+
     parts = []
     
     if isinstance(content, str):
@@ -199,7 +205,7 @@ def _convert_content_to_parts(content: Any) -> List[gemini_types.Part]:
     return parts
 
 
-def get_gemini_contents(messages: List[Dict[str, Any]]) -> List[gemini_types.Content]:
+def get_gemini_contents(messages: List[Dict[str, Any]]) -> List["gemini_types.Content"]:
     """
     Convert OpenAI-style messages to Gemini Contents.
     
@@ -209,6 +215,8 @@ def get_gemini_contents(messages: List[Dict[str, Any]]) -> List[gemini_types.Con
     Returns:
         List of Gemini Content objects
     """
+    from google.genai import types as gemini_types
+
     contents = []
     
     for message in messages:
@@ -238,7 +246,7 @@ def get_gemini_contents(messages: List[Dict[str, Any]]) -> List[gemini_types.Con
     return contents
 
 
-def gemini_usage_details(response: gemini_types.GenerateContentResponse) -> UsageMetadata:
+def gemini_usage_details(response: "gemini_types.GenerateContentResponse") -> UsageMetadata:
     """
     Get usage details from a Gemini API response.
     """
@@ -250,18 +258,8 @@ def gemini_usage_details(response: gemini_types.GenerateContentResponse) -> Usag
     )
 
 
-def get_gemini_response(client: gemini_client, params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
-    """
-    Get a response from the Gemini API.
-    
-    Args:
-        client: Gemini client instance
-        params: Parameters including model, messages, and config options
-        
-    Returns:
-        AI response content as string
-    """
-    model = params.get("model")
+def _gemini_request(params: Dict[str, Any], debug: bool) -> Tuple[Dict[str, Any], Optional[BaseModel]]:
+    """Build generate_content kwargs from params, returning them with the effective response_format."""
     messages = params.get("messages", [])
 
     if debug:
@@ -270,9 +268,8 @@ def get_gemini_response(client: gemini_client, params: Dict[str, Any], debug: bo
     config = get_gemini_config(params)
     contents = get_gemini_contents(messages)
 
-    use_google_search = params.get("use_google_search")
     response_format = params.get("response_format")
-    if use_google_search and response_format:
+    if params.get("use_google_search") and response_format:
         print(f"Warning: use_google_search is not supported with response_format, ignoring response_format.")
         response_format = None
 
@@ -280,17 +277,23 @@ def get_gemini_response(client: gemini_client, params: Dict[str, Any], debug: bo
         for k, v in params.items():
             if k != 'messages':
                 print(f'{k}: {v}')
-    
-    response = client.models.generate_content(
-        model=model, 
-        contents=contents, 
-        config=config
-    )
 
+    request = {"model": params.get("model"), "contents": contents, "config": config}
+    return request, response_format
+
+
+def _gemini_result(
+    response: Any,
+    response_format: Optional[BaseModel],
+    use_google_search: bool,
+    raw_response: bool
+) -> Any:
     return_value = response.text
     if response_format:
-        return_value = response_format(**response.parsed)
+        # The SDK has already parsed the JSON; validate it without re-unpacking as kwargs
+        return_value = response_format.model_validate(response.parsed)
     elif use_google_search:
+        _complete_gemini_models()
         grounding_metadata = response.candidates[0].grounding_metadata
         return_value = AiSearchResult(
             text=response.text,
@@ -304,3 +307,61 @@ def get_gemini_response(client: gemini_client, params: Dict[str, Any], debug: bo
         )
     return return_value
 
+
+def get_gemini_response(client: "GeminiClient", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    """
+    Get a response from the Gemini API.
+    
+    Args:
+        client: Gemini client instance
+        params: Parameters including model, messages, and config options
+        
+    Returns:
+        AI response content as string
+    """
+    request, response_format = _gemini_request(params, debug)
+    response = client.models.generate_content(**request)
+    return _gemini_result(response, response_format, params.get("use_google_search"), raw_response)
+
+
+async def aget_gemini_response(client: "GeminiClient", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    """
+    Async version of get_gemini_response.
+    
+    Args:
+        client: Gemini client instance; its async API (client.aio) is used
+        params: Parameters including model, messages, and config options
+        
+    Returns:
+        AI response content as string
+    """
+    request, response_format = _gemini_request(params, debug)
+    response = await client.aio.models.generate_content(**request)
+    return _gemini_result(response, response_format, params.get("use_google_search"), raw_response)
+
+
+def get_gemini_stream(client: "GeminiClient", params: Dict[str, Any], debug: bool = False) -> Iterator[str]:
+    """
+    Stream text chunks from the Gemini API.
+    
+    Args:
+        client: Gemini client instance
+        params: Parameters including model, messages, and config options
+        
+    Yields:
+        Text chunks as they are generated
+    """
+    messages = params.get("messages", [])
+    if debug:
+        print_debug_messages(messages=messages, params=params)
+
+    config = get_gemini_config(params)
+    contents = get_gemini_contents(messages)
+
+    for chunk in client.models.generate_content_stream(
+        model=params.get("model"),
+        contents=contents,
+        config=config
+    ):
+        if chunk.text:
+            yield chunk.text
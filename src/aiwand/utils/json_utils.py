@@ -0,0 +1,43 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_option(indent: bool, sort_keys: bool) -> int:
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize obj to a JSON string, using orjson when it is installed.
+    Non-ASCII characters are kept as-is; indent uses 2 spaces.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_orjson_option(indent, sort_keys)).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False)
+
+
+def json_dumpb(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes, like json_dumps.
+    With orjson this skips the decode/encode round trip, which suits writing to files.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_orjson_option(indent, sort_keys))
+    return json_dumps(obj, indent=indent, sort_keys=sort_keys).encode("utf-8")
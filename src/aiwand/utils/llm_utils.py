@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type
 
 def get_system_msg(messages: List[Dict[str, Any]]) -> Optional[str]:
     """
@@ -8,3 +9,12 @@ def get_system_msg(messages: List[Dict[str, Any]]) -> Optional[str]:
         if message.get("role") == "system":
             return message.get("content", "")
     return None
+
+
+@lru_cache(maxsize=128)
+def get_json_schema(model_class: Type[Any]) -> Dict[str, Any]:
+    """
+    JSON schema of a pydantic model class, generated once per class.
+    The result is shared: copy it before handing it to code that may modify it.
+    """
+    return model_class.model_json_schema()
@@ -1,8 +1,10 @@
-from openai import OpenAI
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Iterator
 from .extras import print_debug_messages, remove_empty_values
 from ..models import FullAiResponse, UsageMetadata
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
 
 def openai_config_params(params: Dict[str, Any]) -> Dict[str, Any]:
     config = {
@@ -17,6 +19,10 @@ def openai_config_params(params: Dict[str, Any]) -> Dict[str, Any]:
     response_format = params.get("response_format")
     if response_format:
         config["text_format"] = response_format
+    prompt_cache_key = params.get("prompt_cache_key")
+    if prompt_cache_key:
+        # Sent as a raw body field so older SDK versions without the argument still work
+        config["extra_body"] = {"prompt_cache_key": prompt_cache_key}
     return remove_empty_values(config)
 
 
@@ -44,16 +50,10 @@ def responses_usage_details(response: Any) -> UsageMetadata:
     )
 
 
-def get_openai_response(client: OpenAI, params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
-    if debug:
-        print_debug_messages(messages=params.get("messages"), params=params)
-    response_format = params.get("response_format")
-    config = openai_config_params(params)
-    if response_format:
-        full_response = client.responses.parse(**config)
+def _openai_result(full_response: Any, structured: bool, raw_response: bool) -> Any:
+    if structured:
         return_value = full_response.output_parsed
     else:
-        full_response = client.responses.create(**config)
         return_value = full_response.output_text.strip()
     if raw_response:
         return_value = FullAiResponse(
@@ -62,3 +62,40 @@ def get_openai_response(client: OpenAI, params: Dict[str, Any], debug: bool = Fa
             raw_response=full_response
         )
     return return_value
+
+
+def get_openai_response(client: "OpenAI", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    if debug:
+        print_debug_messages(messages=params.get("messages"), params=params)
+    response_format = params.get("response_format")
+    config = openai_config_params(params)
+    if response_format:
+        full_response = client.responses.parse(**config)
+    else:
+        full_response = client.responses.create(**config)
+    return _openai_result(full_response, bool(response_format), raw_response)
+
+
+async def aget_openai_response(client: "AsyncOpenAI", params: Dict[str, Any], debug: bool = False, raw_response: bool = False) -> str:
+    """Async version of get_openai_response."""
+    if debug:
+        print_debug_messages(messages=params.get("messages"), params=params)
+    response_format = params.get("response_format")
+    config = openai_config_params(params)
+    if response_format:
+        full_response = await client.responses.parse(**config)
+    else:
+        full_response = await client.responses.create(**config)
+    return _openai_result(full_response, bool(response_format), raw_response)
+
+
+def get_openai_stream(client: "OpenAI", params: Dict[str, Any], debug: bool = False) -> Iterator[str]:
+    """
+    Stream text chunks from the OpenAI Responses API.
+    """
+    if debug:
+        print_debug_messages(messages=params.get("messages"), params=params)
+    config = openai_config_params(params)
+    for event in client.responses.create(**config, stream=True):
+        if event.type == "response.output_text.delta" and event.delta:
+            yield event.delta
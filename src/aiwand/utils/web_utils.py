@@ -1,8 +1,15 @@
+import atexit
+import threading
+import importlib.util
 import urllib.request
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import List
-import httpx
+from typing import TYPE_CHECKING, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    # bs4 and httpx are imported when first used, keeping them off `import aiwand`
+    import httpx
+    from bs4 import BeautifulSoup
 
 from ..models import LinkContent
 from .file_utils import is_remote_url
@@ -10,12 +17,16 @@ from .file_utils import is_remote_url
 
 def fetch_all_data(
     links: List[str],
-    timeout: int = 30
+    timeout: int = 30,
+    max_workers: Optional[int] = None
 ) -> List[LinkContent]:
     """
     Fetch content from multiple URLs with proper error handling.
+    Links are fetched in parallel; results keep the order of links.
     Args:
         links (List[str]): List of URLs to fetch content from
+        timeout (int): Request timeout in seconds (default: 30)
+        max_workers (Optional[int]): Maximum number of parallel fetches (default: min(20, len(links)))
     Returns:
         List[LinkContent]: List of LinkContent        
     Raises:
@@ -23,22 +34,54 @@ def fetch_all_data(
         urllib.error.URLError: If the URL can't be reached
         urllib.error.HTTPError: If the server returns an error status
     """
-    all_data = []
-    for link in links:
-        try:
-            if not is_remote_url(link):
-                data = read_file_content(link)
-            else:
-                data = fetch_data(url=link, timeout=timeout)
-            link_data = LinkContent(
-                url=link,
-                content=data
-            )
-            all_data.append(link_data)
-        except Exception as e:
-            print(f"Error fetching content from {link}: {str(e)}")
-            continue
-    return all_data
+    if not links:
+        return []
+    if max_workers is None:
+        max_workers = min(20, len(links))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda link: _fetch_link(link, timeout), links))
+    return [link_data for link_data in results if link_data is not None]
+
+
+def _fetch_link(link: str, timeout: int = 30) -> Optional[LinkContent]:
+    """Fetch a single URL or local file, returning None on failure."""
+    try:
+        if not is_remote_url(link):
+            data = read_file_content(link)
+        else:
+            data = fetch_data(url=link, timeout=timeout)
+        return LinkContent(
+            url=link,
+            content=data
+        )
+    except Exception as e:
+        print(f"Error fetching content from {link}: {str(e)}")
+        return None
+
+
+# Connection pool shared by all link and document fetches, created on first use
+_web_client: Optional["httpx.Client"] = None
+_web_client_lock = threading.Lock()
+
+
+def _get_web_client() -> "httpx.Client":
+    """
+    Get the shared httpx client for fetching links, so repeated fetches from
+    the same host reuse connections. HTTP/2 is used when `h2` is installed.
+    """
+    global _web_client
+    if _web_client is None:
+        with _web_client_lock:
+            if _web_client is None:
+                import httpx
+                _web_client = httpx.Client(
+                    headers={'User-Agent': 'AIWand/1.0 (Content Extraction Tool)'},
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    follow_redirects=True,
+                )
+                atexit.register(_web_client.close)
+    return _web_client
 
 
 def fetch_doc(doc_url: str, timeout: int = 30) -> str:
@@ -46,7 +89,7 @@ def fetch_doc(doc_url: str, timeout: int = 30) -> str:
     Fetch a document from a URL.
     """
     try:
-        return httpx.get(doc_url).content
+        return _get_web_client().get(doc_url, timeout=timeout).content
     except Exception as e:
         raise ValueError(f"Error fetching document from {doc_url}: {str(e)}")
 
@@ -56,20 +99,26 @@ def get_soup(
         timeout: int = 30,
         parser: str = 'html.parser',
         **kwargs
-     ) -> BeautifulSoup:
+     ) -> "BeautifulSoup":
     """
     Get a BeautifulSoup object for a given URL.
     """
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
-    req = urllib.request.Request(
-        url,
-        headers={
-            'User-Agent': 'AIWand/1.0 (Content Extraction Tool)'
-        }
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as response:
-        return BeautifulSoup(response.read(), parser, **kwargs)
+    import httpx
+    try:
+        response = _get_web_client().get(url, timeout=timeout)
+        response.raise_for_status()
+    # Keep raising urllib errors, which fetch_data documents
+    except httpx.HTTPStatusError as e:
+        raise urllib.error.HTTPError(
+            url, e.response.status_code, e.response.reason_phrase, e.response.headers, None
+        )
+    except httpx.RequestError as e:
+        raise urllib.error.URLError(str(e) or type(e).__name__)
+    
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(response.content, parser, **kwargs)
 
 
 def fetch_data(url: str, timeout: int = 30) -> str:
@@ -3,16 +3,25 @@
 Quick test script to verify AIWand package installation and basic functionality
 """
 
+import importlib.util
+
+
 def test_import():
     """Test that the package can be imported successfully."""
+    # Check the package is installed before paying for the full import
+    if importlib.util.find_spec("aiwand") is None:
+        print("✗ Package import failed: aiwand is not installed")
+        return False
+    
     try:
         import aiwand
         print("✓ Package import successful")
         
         # Check available functions
+        available = set(dir(aiwand))
         functions = ['summarize', 'chat', 'generate_text', 'setup_user_preferences', 'show_current_config', 'AIError']
         for func in functions:
-            if hasattr(aiwand, func):
+            if func in available:
                 print(f"✓ Function '{func}' is available")
             else:
                 print(f"✗ Function '{func}' is missing")